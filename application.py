@@ -3,7 +3,7 @@
 # ===============================
 
 # Flask framework for creating the web application
-from flask import Flask, request, render_template  
+from flask import Flask, request, render_template, jsonify  
 
 # Data manipulation libraries
 import numpy as np
@@ -15,6 +15,8 @@ from sklearn.preprocessing import StandardScaler
 # Importing custom modules for data and prediction pipeline
 # (These are from your local 'src/pipeline' folder)
 from src.pipeline.predict_pipeline import CustomData, PredictPipeline  
+from src.components.drift_monitor import DriftMonitor  
+from src.pipeline.rollout_pipeline import ModelRollout  
 
 
 # ===============================
@@ -27,6 +29,14 @@ application = Flask(__name__)
 # Assign alias for easier reference
 app = application  
 
+# Primary model + optional shadow/canary candidate (see ModelRolloutConfig)
+model_rollout = ModelRollout()  
+
+# Online input/prediction drift monitoring against artifacts/train.csv
+# (prediction baseline = serving model's predictions on that data)
+drift_monitor = DriftMonitor(predictor=model_rollout.primary)  
+drift_monitor.start()  
+
 
 # ===============================
 # 🏠 Route for Home Page
@@ -81,16 +91,44 @@ def predict_datapoint():
         pred_df = data.get_data_as_data_frame()  
         print(pred_df)  # Debugging purpose: print input data
 
-        # Initialize PredictPipeline object 
-        predict_pipeline = PredictPipeline()  
+        # Run the ML model prediction (candidate runs in the background)
+        results, served_by = model_rollout.predict_with_source(pred_df)  
 
-        # Run the ML model prediction
-        results = predict_pipeline.predict(pred_df)  
+        # Update drift sketches (constant memory, no raw request logging).
+        # Prediction baseline is the primary model's, so canary answers are left out
+        drift_monitor.update(pred_df, results if served_by == "primary" else None)  
 
         # Return the result to the home.html template
         return render_template('home.html', results=results[0])  
 
 
+# ===============================
+# 📈 Route for Drift Report
+# ===============================
+
+@app.route('/drift', methods=['GET'])
+def drift_report():
+    """
+    Return the latest background drift report as JSON.
+    Pass ?refresh=1 to recompute it immediately.
+    """
+    if request.args.get('refresh'):
+        return jsonify(drift_monitor.compute_drift())
+    return jsonify(drift_monitor.latest_report)
+
+
+# ===============================
+# 🚦 Route for Rollout Stats
+# ===============================
+
+@app.route('/rollout', methods=['GET'])
+def rollout_stats():
+    """
+    Return primary vs. candidate latency and agreement as JSON.
+    """
+    return jsonify(model_rollout.get_stats())
+
+
 # ===============================
 # ⚙️ Run Flask App (Entry Point)
 # ===============================
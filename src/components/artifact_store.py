@@ -0,0 +1,272 @@
+# ======================================
+# 📦 Import Required Libraries
+# ======================================
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+from src.exception import CustomException
+from src.logger import logging
+
+
+# ======================================
+# ⚙️ ArtifactStoreConfig → Configuration Class
+# ======================================
+# Layout under store_root:
+#   objects/<sha256>.pkl     → content-addressed, deduplicated artifacts
+#   versions/<version>.json  → manifest pinning model + preprocessor + schema
+#   ACTIVE                   → pointer to the serving version (atomic flip)
+#   history.log              → "activate <version>" / "rollback <version>" lines
+@dataclass
+class ArtifactStoreConfig:
+    store_root: str = os.path.join("artifacts", "store")
+
+
+def _atomic_write(path, data):
+    """
+    Write bytes to ``path`` via a temp file + os.replace, so readers see
+    either the old or the new content, never a partial file.
+    """
+    dir_path = os.path.dirname(path)
+    os.makedirs(dir_path, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ======================================
+# 🗄️ ArtifactStore Class
+# ======================================
+class ArtifactStore:
+    """
+    Versioned, content-addressed store for model/preprocessor pairs.
+
+    1. ``publish`` hashes each artifact, stores it once, and writes a manifest.
+    2. ``activate`` flips the ACTIVE pointer (a few bytes, atomic rename).
+    3. ``rollback`` steps back through previously deployed versions.
+
+    Deploys and rollbacks never copy or retrain anything.
+    """
+
+    def __init__(self, config=None):
+        self.config = config or ArtifactStoreConfig()
+        self.objects_dir = os.path.join(self.config.store_root, "objects")
+        self.versions_dir = os.path.join(self.config.store_root, "versions")
+        self.pointer_path = os.path.join(self.config.store_root, "ACTIVE")
+        self.history_path = os.path.join(self.config.store_root, "history.log")
+
+    # -------------------------------
+    # Content-addressed objects
+    # -------------------------------
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, f"{digest}.pkl")
+
+    def _put_bytes(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        # Same content → same digest → stored once
+        if not os.path.exists(path):
+            _atomic_write(path, data)
+        return digest
+
+    def put_file(self, file_path):
+        try:
+            with open(file_path, "rb") as file_obj:
+                return self._put_bytes(file_obj.read())
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    # -------------------------------
+    # Versions (manifests)
+    # -------------------------------
+    def publish(self, model_path, preprocessor_path, schema=None, metadata=None, activate=True):
+        """
+        Store a model + preprocessor pair and record them in one manifest.
+
+        Parameters:
+        -----------
+        model_path, preprocessor_path : str
+            Files written by ModelTrainer / DataTransformation.
+        schema : dict, optional
+            Input/target columns the preprocessor expects.
+        metadata : dict, optional
+            Free-form info (scores, run id, ...). Every publish is appended to
+            the manifest's ``runs``; ``metadata`` holds the latest run's.
+        activate : bool
+            Flip the ACTIVE pointer to the new version.
+
+        Returns:
+        --------
+        str
+            Version id (derived from the pinned content, so re-publishing
+            identical artifacts yields the same version).
+        """
+        try:
+            pinned = {
+                "model": self.put_file(model_path),
+                "preprocessor": self.put_file(preprocessor_path),
+                "schema": schema or {},
+            }
+            version_id = hashlib.sha256(json.dumps(pinned, sort_keys=True).encode()).hexdigest()[:12]
+
+            manifest_path = os.path.join(self.versions_dir, f"{version_id}.json")
+            run = {"published_at": time.time(), "metadata": metadata or {}}
+            if os.path.exists(manifest_path):
+                # Identical artifacts from a new run: same version, keep this run's metadata too
+                manifest = self.load_manifest(version_id)
+                manifest.setdefault("runs", [{"published_at": manifest["created_at"], "metadata": manifest["metadata"]}])
+                logging.info(f"📦 Artifact version {version_id} re-published by a new run")
+            else:
+                manifest = dict(pinned, version=version_id, created_at=run["published_at"], runs=[])
+                logging.info(f"📦 Published artifact version {version_id}")
+            manifest["runs"].append(run)
+            manifest["metadata"] = run["metadata"]
+            _atomic_write(manifest_path, json.dumps(manifest, indent=2).encode())
+
+            if activate:
+                self.activate(version_id)
+            return version_id
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def load_manifest(self, version_id):
+        try:
+            with open(os.path.join(self.versions_dir, f"{version_id}.json")) as manifest_file:
+                return json.load(manifest_file)
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def list_versions(self):
+        if not os.path.isdir(self.versions_dir):
+            return []
+        manifests = [self.load_manifest(name[:-len(".json")])
+                     for name in os.listdir(self.versions_dir) if name.endswith(".json")]
+        return sorted(manifests, key=lambda m: m["created_at"])
+
+    # -------------------------------
+    # Active pointer
+    # -------------------------------
+    def active_version(self):
+        if not os.path.exists(self.pointer_path):
+            return None
+        with open(self.pointer_path) as pointer_file:
+            return pointer_file.read().strip() or None
+
+    def active_manifest(self):
+        version_id = self.active_version()
+        return self.load_manifest(version_id) if version_id else None
+
+    def activate(self, version_id, _action="activate"):
+        """
+        Make ``version_id`` the serving version by atomically replacing ACTIVE.
+        """
+        try:
+            manifest = self.load_manifest(version_id)
+            for key in ("model", "preprocessor"):
+                if not os.path.exists(self.object_path(manifest[key])):
+                    raise FileNotFoundError(f"{key} object {manifest[key]} missing for version {version_id}")
+
+            _atomic_write(self.pointer_path, version_id.encode())
+            with open(self.history_path, "a") as history_file:
+                history_file.write(f"{_action} {version_id}\n")
+
+            logging.info(f"✅ Activated artifact version {version_id}")
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def deploy_stack(self):
+        """
+        Replay history.log into a stack of deployed versions, newest last.
+
+        An activation pushes its version; a rollback pops back down to its
+        target. Repeated rollbacks therefore keep moving back instead of
+        bouncing between the last two versions.
+        """
+        stack = []
+        if not os.path.exists(self.history_path):
+            return stack
+        with open(self.history_path) as history_file:
+            for line in history_file:
+                parts = line.split()
+                if not parts:
+                    continue
+                # Bare version ids are plain activations
+                action, version_id = parts if len(parts) == 2 else ("activate", parts[0])
+                if action == "rollback" and version_id in stack:
+                    del stack[stack.index(version_id) + 1:]
+                elif not stack or stack[-1] != version_id:
+                    stack.append(version_id)
+        return stack
+
+    def rollback(self, steps=1):
+        """
+        Re-activate the version deployed ``steps`` deploys before the current one.
+        """
+        try:
+            stack = self.deploy_stack()
+            if len(stack) <= steps:
+                raise ValueError("No earlier artifact version to roll back to")
+
+            target = stack[-1 - steps]
+            self.activate(target, _action="rollback")
+            return target
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def resolve(self, version_id=None):
+        """
+        Paths of the model and preprocessor pinned by a version.
+
+        Returns:
+        --------
+        tuple or None
+            ``(model_path, preprocessor_path)`` for ``version_id`` (default: the
+            active version), or None if the store has no active version.
+        """
+        version_id = version_id or self.active_version()
+        if version_id is None:
+            return None
+        manifest = self.load_manifest(version_id)
+        return self.object_path(manifest["model"]), self.object_path(manifest["preprocessor"])
+
+
+# ======================================
+# ⚙️ Command Line Entry Point
+# ======================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage versioned model artifacts")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list")
+    activate_parser = subparsers.add_parser("activate")
+    activate_parser.add_argument("version")
+    rollback_parser = subparsers.add_parser("rollback")
+    rollback_parser.add_argument("--steps", type=int, default=1)
+    args = parser.parse_args()
+
+    store = ArtifactStore()
+    if args.command == "list":
+        active = store.active_version()
+        for manifest in store.list_versions():
+            marker = "*" if manifest["version"] == active else " "
+            print(f"{marker} {manifest['version']}  {time.ctime(manifest['created_at'])}  {manifest['metadata']}")
+    elif args.command == "activate":
+        store.activate(args.version)
+    else:
+        print(store.rollback(args.steps))
@@ -2,6 +2,7 @@ import os
 import sys
 from src.exception import CustomException
 from src.logger import logging
+from src.profiler import profiler
 import pandas as pd
 
 from sklearn.model_selection import train_test_split
@@ -12,6 +13,7 @@ from src.components.data_transformation import DataTransformationConfig
 
 from src.components.model_trainer import ModelTrainerConfig
 from src.components.model_trainer import ModelTrainer
+from src.components.artifact_store import ArtifactStore
 @dataclass
 class DataIngestionConfig:
     train_data_path: str=os.path.join('artifacts',"train.csv")
@@ -22,6 +24,7 @@ class DataIngestion:
     def __init__(self):
         self.ingestion_config=DataIngestionConfig()
 
+    @profiler.profile("data_ingestion")
     def initiate_data_ingestion(self):
         logging.info("Entered the data ingestion method or component")
         try:
@@ -55,7 +58,33 @@ if __name__=="__main__":
     train_data,test_data=obj.initiate_data_ingestion()
 
     data_transformation=DataTransformation()
-    train_arr,test_arr,_=data_transformation.initiate_data_transformation(train_data,test_data)
+    train_arr,test_arr,preprocessor_path=data_transformation.initiate_data_transformation(train_data,test_data)
 
     modeltrainer=ModelTrainer()
-    print(modeltrainer.initiate_model_trainer(train_arr,test_arr))
\ No newline at end of file
+    r2_square=modeltrainer.initiate_model_trainer(train_arr,test_arr)
+    print(r2_square)
+
+    # Compact dtype run → selected model-এর float64 parity check; fail করলে activate হবে না
+    # (compact pair artifacts/compact/ এ আছে, artifacts/ এর fallback pair অপরিবর্তিত)
+    metadata={"r2_score": r2_square}
+    parity_ok=True
+    if data_transformation.data_transformation_config.compact_dtypes:
+        parity_report=data_transformation.check_compact_parity(
+            train_data,test_data,models={modeltrainer.best_model_name: modeltrainer.best_model}
+        )
+        metadata["compact_parity"]=parity_report
+        parity_ok=parity_report["parity_ok"]
+        if not parity_ok:
+            logging.error("❌ Compact dtype parity failed, publishing without activating")
+
+    # Pin this run's model + preprocessor together and make it the serving version
+    ArtifactStore().publish(
+        modeltrainer.model_trainer_config.trained_model_file_path,
+        preprocessor_path,
+        schema=data_transformation.get_schema(),
+        metadata=metadata,
+        activate=parity_ok,
+    )
+
+    # Only writes a report when PROFILE_TRAINING=1
+    profiler.write_report()
@@ -6,17 +6,85 @@ import pandas as pd
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, StandardScaler
 from src.exception import CustomException
 from src.logger import logging
+from src.profiler import profiler
 import os
 from src.utils import save_object
 
 # ------------------ Data Transformation Configuration ------------------
 @dataclass
 class DataTransformationConfig:
+    # COMPACT_DTYPES=1 → categorical codes, int8/float32 scores, float32 feature matrix
+    compact_dtypes = os.environ.get("COMPACT_DTYPES", "0") == "1"
+    # Compact run-এর artifact আলাদা folder-এ থাকে: artifacts/ এর fixed pair হলো store খালি থাকলে
+    # serving fallback, তাই parity check pass না করা compact pair সেখানে লেখা হবে না।
+    # Compact pair শুধু store version হিসেবে (parity OK হলে active) serve হয়।
+    artifacts_dir = os.path.join('artifacts', 'compact') if compact_dtypes else 'artifacts'
     # artifacts ফোল্ডারের মধ্যে preprocessor object সংরক্ষণ করা হবে
-    preprocessor_obj_file_path = os.path.join('artifacts', "preprocessor.pkl")
+    preprocessor_obj_file_path = os.path.join(artifacts_dir, "preprocessor.pkl")
+    # Input/target columns → preprocessor এবং artifact manifest দুই জায়গাতেই ব্যবহার হয়
+    numerical_columns = ["writing_score", "reading_score"]
+    categorical_columns = [
+        "gender",
+        "race_ethnicity",
+        "parental_level_of_education",
+        "lunch",
+        "test_preparation_course",
+    ]
+    target_column_name = "math_score"
+
+
+# ------------------ Compact dtype helpers ------------------
+def to_compact_dtypes(df):
+    '''
+    Categorical columns → pandas "category" (ছোট integer codes),
+    score columns → int8 যদি সব value integer ও int8 range-এর মধ্যে হয়, না হলে float32।
+    '''
+    config = DataTransformationConfig
+    df = df.copy()
+    for column in config.categorical_columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    for column in config.numerical_columns + [config.target_column_name]:
+        if column not in df.columns:
+            continue
+        values = df[column].astype(np.float32)
+        is_int8 = (
+            values.notna().all()
+            and (values == np.round(values)).all()
+            and values.between(np.iinfo(np.int8).min, np.iinfo(np.int8).max).all()
+        )
+        df[column] = values.astype(np.int8) if is_int8 else values
+    return df
+
+
+def read_csv(path, compact=False):
+    '''
+    CSV পড়া; compact mode-এ parse করার সময়েই ছোট dtype ব্যবহার করা হয়।
+    '''
+    if not compact:
+        return pd.read_csv(path)
+    config = DataTransformationConfig
+    dtype = {column: "category" for column in config.categorical_columns}
+    dtype.update({column: np.float32 for column in config.numerical_columns + [config.target_column_name]})
+    return to_compact_dtypes(pd.read_csv(path, dtype=dtype))
+
+
+def _seeded(model, seed=0):
+    # Random model হলে fixed seed; LinearRegression-এর মতো model-এ random_state নেই
+    try:
+        return model.set_params(random_state=seed)
+    except ValueError:
+        return model
+
+
+def _to_float32(X):
+    # Dense এবং sparse দুই ধরনের output-এর জন্যই কাজ করে
+    return X.astype(np.float32)
 
 
 # ------------------ Data Transformation Class ------------------
@@ -25,21 +93,19 @@ class DataTransformation:
         # config initialize করা হচ্ছে
         self.data_transformation_config = DataTransformationConfig()
 
-    def get_data_transformer_object(self):
+    def get_data_transformer_object(self, compact=None):
         '''
         এই function টি data transformation-এর জন্য preprocessing pipeline তৈরি করে।
         Numerical এবং Categorical data আলাদা করে handle করা হয়।
+        compact=True হলে preprocessor float32 matrix return করে।
         '''
         try:
+            if compact is None:
+                compact = self.data_transformation_config.compact_dtypes
+
             # Numerical এবং Categorical columns আলাদা করা
-            numerical_columns = ["writing_score", "reading_score"]
-            categorical_columns = [
-                "gender",
-                "race_ethnicity",
-                "parental_level_of_education",
-                "lunch",
-                "test_preparation_course",
-            ]
+            numerical_columns = self.data_transformation_config.numerical_columns
+            categorical_columns = self.data_transformation_config.categorical_columns
 
             # -------- Numerical Pipeline --------
             # Step 1: Missing value handle (median দিয়ে)
@@ -58,7 +124,7 @@ class DataTransformation:
             cat_pipeline = Pipeline(
                 steps=[
                     ("imputer", SimpleImputer(strategy="most_frequent")),
-                    ("one_hot_encoder", OneHotEncoder()),
+                    ("one_hot_encoder", OneHotEncoder(dtype=np.float32 if compact else np.float64)),
                     ("scaler", StandardScaler(with_mean=False))
                 ]
             )
@@ -75,6 +141,16 @@ class DataTransformation:
                 ]
             )
 
+            # -------- Compact mode: final output float32 --------
+            # Cast টা preprocessor-এর ভিতরেই রাখা, তাই prediction-এর সময়ও float32 আসে
+            if compact:
+                preprocessor = Pipeline(
+                    steps=[
+                        ("preprocessor", preprocessor),
+                        ("to_float32", FunctionTransformer(_to_float32)),
+                    ]
+                )
+
             return preprocessor
         
         except Exception as e:
@@ -82,43 +158,136 @@ class DataTransformation:
             raise CustomException(e, sys)
         
 
-    def initiate_data_transformation(self, train_path, test_path):
+    def get_schema(self):
         '''
-        এই function টি পুরো data transformation process handle করে।
-        Train/Test data পড়া, preprocessing apply করা, এবং preprocessor save করা।
+        Preprocessor যে input/target columns আশা করে, artifact manifest-এ pin করার জন্য।
+        '''
+        return {
+            "numerical_columns": list(self.data_transformation_config.numerical_columns),
+            "categorical_columns": list(self.data_transformation_config.categorical_columns),
+            "target_column": self.data_transformation_config.target_column_name,
+            "compact_dtypes": self.data_transformation_config.compact_dtypes,
+        }
+
+    def transform_data(self, train_df, test_df, compact=None):
+        '''
+        Preprocessor fit করে train/test array (features + target) তৈরি করে, কিছু save করে না।
+        '''
+        # -------- Step 2: Preprocessing object পাওয়া --------
+        preprocessing_obj = self.get_data_transformer_object(compact)
+        logging.info("✅ Preprocessing object পাওয়া গেছে।")
+
+        # -------- Step 3: Target এবং Input features আলাদা করা --------
+        target_column_name = self.data_transformation_config.target_column_name
+
+        input_feature_train_df = train_df.drop(columns=[target_column_name])
+        target_feature_train_df = train_df[target_column_name]
+
+        input_feature_test_df = test_df.drop(columns=[target_column_name])
+        target_feature_test_df = test_df[target_column_name]
+
+        logging.info("✅ Train/Test features split করা হয়েছে।")
+
+        # -------- Step 4: Transformation apply করা --------
+        input_feature_train_arr = preprocessing_obj.fit_transform(input_feature_train_df)
+        input_feature_test_arr = preprocessing_obj.transform(input_feature_test_df)
+
+        logging.info("✅ Preprocessing apply করা হয়েছে।")
+
+        # -------- Step 5: Target array এর সাথে merge করা --------
+        # float32 features + int8 target → np.c_ float32 রাখে; default mode আগের মতো float64
+        train_arr = np.c_[input_feature_train_arr, np.array(target_feature_train_df)]
+        test_arr = np.c_[input_feature_test_arr, np.array(target_feature_test_df)]
+
+        return train_arr, test_arr, preprocessing_obj
+
+    def check_compact_parity(self, train_path, test_path, models=None, r2_tolerance=1e-3, prediction_tolerance=1.0):
+        '''
+        float64 এবং compact path দুটো চালিয়ে memory saving ও accuracy parity report করে।
+        models না দিলে ModelTrainer-এর সব model check করা হয়; training-এর সময় শুধু
+        selected best model দেওয়া হয়। কোনো artifact save হয় না।
+
+        Parity OK মানে প্রতিটি model-এর R2 diff <= r2_tolerance এবং
+        max prediction diff <= prediction_tolerance (score point)।
         '''
         try:
-            # -------- Step 1: Train এবং Test CSV file পড়া --------
-            train_df = pd.read_csv(train_path)
-            test_df = pd.read_csv(test_path)
+            if models is None:
+                # Local import: model_trainer heavy libraries শুধু এখানে লাগে
+                from src.components.model_trainer import ModelTrainer
+                models = ModelTrainer().get_models()
 
-            logging.info("✅ Train এবং Test data read complete হয়েছে।")
+            arrays, memory = {}, {}
+            for mode, compact in (("float64", False), ("compact", True)):
+                train_df = read_csv(train_path, compact=compact)
+                test_df = read_csv(test_path, compact=compact)
+                train_arr, test_arr, _ = self.transform_data(train_df, test_df, compact=compact)
+                arrays[mode] = (train_arr, test_arr)
+                memory[mode] = {
+                    "frame_bytes": int(train_df.memory_usage(deep=True).sum() + test_df.memory_usage(deep=True).sum()),
+                    "array_bytes": int(train_arr.nbytes + test_arr.nbytes),
+                    "array_dtype": str(train_arr.dtype),
+                }
 
-            # -------- Step 2: Preprocessing object পাওয়া --------
-            preprocessing_obj = self.get_data_transformer_object()
-            logging.info("✅ Preprocessing object পাওয়া গেছে।")
+            model_reports = {}
+            for model_name, model in models.items():
+                scores, predictions = {}, {}
+                for mode, (train_arr, test_arr) in arrays.items():
+                    # দুই path-এ একই seed, যাতে শুধু dtype-এর পার্থক্য মাপা হয়
+                    fitted = _seeded(clone(model)).fit(train_arr[:, :-1], train_arr[:, -1])
+                    predictions[mode] = np.asarray(fitted.predict(test_arr[:, :-1]), dtype=np.float64)
+                    scores[mode] = float(r2_score(test_arr[:, -1], predictions[mode]))
 
-            # -------- Step 3: Target এবং Input features আলাদা করা --------
-            target_column_name = "math_score"
-            numerical_columns = ["writing_score", "reading_score"]
+                r2_diff = abs(scores["float64"] - scores["compact"])
+                max_prediction_diff = float(np.max(np.abs(predictions["float64"] - predictions["compact"])))
+                model_reports[model_name] = {
+                    "float64_r2_score": scores["float64"],
+                    "compact_r2_score": scores["compact"],
+                    "r2_diff": r2_diff,
+                    "max_prediction_diff": max_prediction_diff,
+                    "parity_ok": r2_diff <= r2_tolerance and max_prediction_diff <= prediction_tolerance,
+                }
 
-            input_feature_train_df = train_df.drop(columns=[target_column_name], axis=1)
-            target_feature_train_df = train_df[target_column_name]
+            report = {
+                "float64": memory["float64"],
+                "compact": memory["compact"],
+                "frame_bytes_saved": memory["float64"]["frame_bytes"] - memory["compact"]["frame_bytes"],
+                "array_bytes_saved": memory["float64"]["array_bytes"] - memory["compact"]["array_bytes"],
+                "models": model_reports,
+                "parity_ok": all(m["parity_ok"] for m in model_reports.values()),
+            }
 
-            input_feature_test_df = test_df.drop(columns=[target_column_name], axis=1)
-            target_feature_test_df = test_df[target_column_name]
+            logging.info(
+                f"📉 Compact dtypes: frames {memory['float64']['frame_bytes']} → {memory['compact']['frame_bytes']} bytes, "
+                f"arrays {memory['float64']['array_bytes']} → {memory['compact']['array_bytes']} bytes"
+            )
+            for model_name, model_report in model_reports.items():
+                logging.info(
+                    f"📉 {model_name}: R2 diff {model_report['r2_diff']:.6f}, "
+                    f"max prediction diff {model_report['max_prediction_diff']:.4f} "
+                    f"(parity {'OK' if model_report['parity_ok'] else 'FAILED'})"
+                )
+            return report
 
-            logging.info("✅ Train/Test features split করা হয়েছে।")
+        except Exception as e:
+            raise CustomException(e, sys)
 
-            # -------- Step 4: Transformation apply করা --------
-            input_feature_train_arr = preprocessing_obj.fit_transform(input_feature_train_df)
-            input_feature_test_arr = preprocessing_obj.transform(input_feature_test_df)
+    @profiler.profile("data_transformation")
+    def initiate_data_transformation(self, train_path, test_path):
+        '''
+        এই function টি পুরো data transformation process handle করে।
+        Train/Test data পড়া, preprocessing apply করা, এবং preprocessor save করা।
+        '''
+        try:
+            # -------- Step 1: Train এবং Test CSV file পড়া --------
+            compact = self.data_transformation_config.compact_dtypes
+            train_df = read_csv(train_path, compact=compact)
+            test_df = read_csv(test_path, compact=compact)
 
-            logging.info("✅ Preprocessing apply করা হয়েছে।")
+            logging.info("✅ Train এবং Test data read complete হয়েছে।")
 
-            # -------- Step 5: Target array এর সাথে merge করা --------
-            train_arr = np.c_[input_feature_train_arr, np.array(target_feature_train_df)]
-            test_arr = np.c_[input_feature_test_arr, np.array(target_feature_test_df)]
+            # -------- Step 2-5: Preprocessing fit/transform এবং target merge --------
+            train_arr, test_arr, preprocessing_obj = self.transform_data(train_df, test_df, compact=compact)
+            logging.info(f"✅ Feature matrix dtype: {train_arr.dtype}, size: {train_arr.nbytes + test_arr.nbytes} bytes")
 
             # -------- Step 6: Preprocessor object save করা --------
             save_object(
@@ -136,3 +305,12 @@ class DataTransformation:
             )
         except Exception as e:
             raise CustomException(e, sys)
+
+
+# ------------------ Compact dtype parity check ------------------
+if __name__ == "__main__":
+    report = DataTransformation().check_compact_parity(
+        os.path.join('artifacts', "train.csv"),
+        os.path.join('artifacts', "test.csv"),
+    )
+    print(report)
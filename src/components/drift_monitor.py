@@ -0,0 +1,394 @@
+# ======================================
+# 📦 Import Required Libraries
+# ======================================
+
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import pandas as pd
+
+from src.exception import CustomException
+from src.logger import logging
+
+
+# ======================================
+# ⚙️ DriftMonitorConfig → Configuration Class
+# ======================================
+# Baseline data, sketch layout and background refresh interval.
+@dataclass
+class DriftMonitorConfig:
+    baseline_data_path: str = os.path.join("artifacts", "train.csv")
+    categorical_columns: tuple = (
+        "gender",
+        "race_ethnicity",
+        "parental_level_of_education",
+        "lunch",
+        "test_preparation_course",
+    )
+    numerical_columns: tuple = ("reading_score", "writing_score")
+    prediction_column: str = "math_score"
+    # Scores live on a 0-100 scale, so fixed-width bins give a constant-size sketch
+    score_range: tuple = (0.0, 100.0)
+    num_bins: int = 20
+    # Categorical counters never grow beyond this many distinct values
+    max_categories: int = 50
+    refresh_interval_seconds: float = 60.0
+    # PSI > 0.2 is the usual "significant shift, consider retraining" rule of thumb.
+    # Below a few hundred rows, sampling noise alone pushes PSI past it
+    # (≈0.2 at 100 rows, ≈0.04 at 500 on resampled training data).
+    drift_threshold: float = 0.2
+    min_samples: int = 500
+    # Live traffic is kept in two rotating windows of this many rows, so drift
+    # is measured on the last window_size..2*window_size rows, not since start
+    window_size: int = 2000
+
+
+# ======================================
+# 📊 HistogramSketch → Fixed-bin numeric sketch
+# ======================================
+class HistogramSketch:
+    """
+    Constant-memory histogram over a fixed value range.
+
+    Out-of-range values are clamped into the first/last bin, so memory
+    never depends on how many values have been seen.
+    """
+
+    def __init__(self, low, high, num_bins):
+        self.low = float(low)
+        self.high = float(high)
+        self.num_bins = int(num_bins)
+        self.width = (self.high - self.low) / self.num_bins
+        self.counts = [0] * self.num_bins
+        self.total = 0
+
+    def _bin_index(self, value):
+        index = int((value - self.low) / self.width)
+        return min(max(index, 0), self.num_bins - 1)
+
+    def update(self, value):
+        value = float(value)
+        if math.isnan(value):
+            return
+        self.counts[self._bin_index(value)] += 1
+        self.total += 1
+
+    def quantile(self, q):
+        """
+        Approximate quantile with linear interpolation inside the target bin.
+        """
+        if self.total == 0:
+            return None
+        target = q * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= target:
+                fraction = (target - cumulative) / count
+                return self.low + (index + fraction) * self.width
+            cumulative += count
+        return self.high
+
+    def copy(self):
+        sketch = HistogramSketch(self.low, self.high, self.num_bins)
+        sketch.counts = list(self.counts)
+        sketch.total = self.total
+        return sketch
+
+    def merge(self, other):
+        """
+        New sketch holding the counts of both (same range and bins).
+        """
+        sketch = self.copy()
+        sketch.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        sketch.total = self.total + other.total
+        return sketch
+
+
+# ======================================
+# 🏷️ CategorySketch → Bounded frequency counter
+# ======================================
+class CategorySketch:
+    """
+    Frequency counter capped at ``max_categories`` distinct values.
+    Anything beyond the cap is folded into a single ``__other__`` bucket.
+    """
+
+    OTHER = "__other__"
+
+    def __init__(self, max_categories):
+        self.max_categories = int(max_categories)
+        self.counts = Counter()
+        self.total = 0
+
+    def update(self, value):
+        key = str(value)
+        if key not in self.counts and len(self.counts) >= self.max_categories:
+            key = self.OTHER
+        self.counts[key] += 1
+        self.total += 1
+
+    def copy(self):
+        sketch = CategorySketch(self.max_categories)
+        sketch.counts = Counter(self.counts)
+        sketch.total = self.total
+        return sketch
+
+    def merge(self, other):
+        """
+        New sketch holding the counts of both, still capped at ``max_categories``.
+        """
+        sketch = self.copy()
+        for key, count in other.counts.items():
+            if key not in sketch.counts and len(sketch.counts) >= sketch.max_categories:
+                key = self.OTHER
+            sketch.counts[key] += count
+        sketch.total += other.total
+        return sketch
+
+
+def population_stability_index(expected, actual, epsilon=1e-4):
+    """
+    PSI between two count vectors that share the same keys/bins.
+
+    Parameters:
+    -----------
+    expected : dict
+        Baseline counts (training distribution).
+    actual : dict
+        Live counts (serving distribution).
+    """
+    expected_total = sum(expected.values())
+    actual_total = sum(actual.values())
+    if expected_total == 0 or actual_total == 0:
+        return None
+
+    psi = 0.0
+    for key in set(expected) | set(actual):
+        e = max(expected.get(key, 0) / expected_total, epsilon)
+        a = max(actual.get(key, 0) / actual_total, epsilon)
+        psi += (a - e) * math.log(a / e)
+    return psi
+
+
+# ======================================
+# 🛰️ DriftMonitor Class
+# ======================================
+class DriftMonitor:
+    """
+    Online input/prediction monitoring for the serving path.
+
+    1. Builds input baseline sketches once from the training CSV.
+    2. Builds the prediction baseline from the serving model's own predictions
+       on that CSV (labels are wider than a regressor's outputs, so comparing
+       against them would mix model error into drift).
+    3. Updates live sketches per request (O(1) memory, a few dict/list increments).
+       Live traffic rotates through two windows of ``window_size`` rows, so
+       old traffic ages out instead of diluting a recent shift.
+    4. Recomputes drift scores (PSI) against the baseline in a background thread.
+
+    Only input drift drives ``retrain_recommended``; prediction drift is reported
+    separately.
+    """
+
+    def __init__(self, config=None, predictor=None):
+        self.config = config or DriftMonitorConfig()
+        # Object with predict(df) / resolve_paths(), e.g. PredictPipeline
+        self.predictor = predictor
+        self._baseline_features = None
+        self._prediction_baseline_key = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.baseline = self._new_sketches()
+        # Current window (being filled) and the previous, completed one
+        self.live = self._new_sketches()
+        self.previous = None
+        self.live_rows = 0
+        self.latest_report = {}
+        self._load_baseline()
+        self._refresh_prediction_baseline()
+
+    def _new_sketches(self):
+        low, high = self.config.score_range
+        sketches = {
+            column: CategorySketch(self.config.max_categories)
+            for column in self.config.categorical_columns
+        }
+        for column in self.config.numerical_columns:
+            sketches[column] = HistogramSketch(low, high, self.config.num_bins)
+        sketches[self.config.prediction_column] = HistogramSketch(low, high, self.config.num_bins)
+        return sketches
+
+    def _load_baseline(self):
+        try:
+            if not os.path.exists(self.config.baseline_data_path):
+                logging.warning(f"⚠️ Drift baseline not found at {self.config.baseline_data_path}")
+                return
+
+            df = pd.read_csv(self.config.baseline_data_path)
+            self._baseline_features = df.drop(columns=[self.config.prediction_column], errors="ignore")
+            for column, sketch in self.baseline.items():
+                # Prediction baseline comes from model outputs, not training labels
+                if column == self.config.prediction_column or column not in df.columns:
+                    continue
+                for value in df[column].dropna():
+                    sketch.update(value)
+
+            logging.info(f"✅ Drift baseline loaded from {self.config.baseline_data_path} ({len(df)} rows)")
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def _refresh_prediction_baseline(self):
+        """
+        (Re)build the prediction baseline whenever the serving model changes.
+        Live prediction counts are reset too, since they came from another model.
+        """
+        if self.predictor is None or self._baseline_features is None:
+            return
+        try:
+            key = self.predictor.resolve_paths()
+            if key == self._prediction_baseline_key:
+                return
+
+            low, high = self.config.score_range
+            sketch = HistogramSketch(low, high, self.config.num_bins)
+            for value in self.predictor.predict(self._baseline_features):
+                sketch.update(value)
+
+            with self._lock:
+                self.baseline[self.config.prediction_column] = sketch
+                for window in (self.live, self.previous):
+                    if window is not None:
+                        window[self.config.prediction_column] = HistogramSketch(low, high, self.config.num_bins)
+                self._prediction_baseline_key = key
+
+            logging.info(f"✅ Prediction baseline rebuilt for model {key[0]}")
+
+        except Exception as e:
+            logging.warning(f"⚠️ Prediction baseline not built: {e}")
+
+    def update(self, features, predictions=None):
+        """
+        Fold one request into the live sketches.
+
+        Parameters:
+        -----------
+        features : pandas.DataFrame
+            The same DataFrame passed to PredictPipeline.predict.
+        predictions : array-like, optional
+            Model outputs for those rows.
+        """
+        try:
+            records = features.to_dict("records")
+            with self._lock:
+                # Rotate between requests, so a batch and its predictions share a window
+                if self.live_rows >= self.config.window_size:
+                    self.previous = self.live
+                    self.live = self._new_sketches()
+                    self.live_rows = 0
+                self.live_rows += len(records)
+                for record in records:
+                    for column in self.config.categorical_columns + self.config.numerical_columns:
+                        value = record.get(column)
+                        if value is not None:
+                            self.live[column].update(value)
+                if predictions is not None:
+                    for value in predictions:
+                        self.live[self.config.prediction_column].update(value)
+
+        except Exception as e:
+            # Monitoring must never break a prediction request
+            logging.warning(f"⚠️ Drift monitor update skipped: {CustomException(e, sys)}")
+
+    def compute_drift(self):
+        """
+        Compute PSI per monitored column against the training baseline,
+        over the current and previous live windows.
+
+        Returns:
+        --------
+        dict
+            Per-input-column PSI, prediction PSI, live quantiles, sample
+            count and a retrain flag (driven by input drift only).
+        """
+        self._refresh_prediction_baseline()
+
+        # Snapshot under the lock so the request path is blocked only for the copy
+        with self._lock:
+            if self.previous is None:
+                live = {column: sketch.copy() for column, sketch in self.live.items()}
+            else:
+                live = {column: sketch.merge(self.previous[column]) for column, sketch in self.live.items()}
+
+        samples = live[self.config.categorical_columns[0]].total if self.config.categorical_columns else 0
+        columns = {}
+        for column, sketch in live.items():
+            baseline = self.baseline[column]
+            if isinstance(sketch, HistogramSketch):
+                expected = dict(enumerate(baseline.counts))
+                actual = dict(enumerate(sketch.counts))
+                quantiles = {f"p{int(q * 100)}": sketch.quantile(q) for q in (0.1, 0.5, 0.9)}
+            else:
+                expected = dict(baseline.counts)
+                actual = dict(sketch.counts)
+                quantiles = None
+
+            columns[column] = {
+                "psi": population_stability_index(expected, actual),
+                "count": sketch.total,
+                "quantiles": quantiles,
+            }
+
+        prediction_drift = columns.pop(self.config.prediction_column)
+        prediction_drift["drifted"] = (
+            prediction_drift["psi"] is not None and prediction_drift["psi"] > self.config.drift_threshold
+        )
+
+        drifted = [
+            column for column, stats in columns.items()
+            if stats["psi"] is not None and stats["psi"] > self.config.drift_threshold
+        ]
+
+        report = {
+            "computed_at": time.time(),
+            "samples": samples,
+            "columns": columns,
+            "prediction_drift": prediction_drift,
+            "drifted_columns": drifted,
+            "retrain_recommended": samples >= self.config.min_samples and bool(drifted),
+        }
+        self.latest_report = report
+
+        if report["retrain_recommended"]:
+            logging.warning(f"⚠️ Input drift detected on {drifted} after {samples} requests, consider retraining")
+
+        return report
+
+    def _run(self):
+        while not self._stop_event.wait(self.config.refresh_interval_seconds):
+            try:
+                self.compute_drift()
+            except Exception as e:
+                logging.error(f"❌ Drift computation failed: {CustomException(e, sys)}")
+
+    def start(self):
+        """
+        Start the background thread that refreshes ``latest_report``.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="drift-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
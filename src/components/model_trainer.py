@@ -15,8 +15,10 @@ from sklearn.tree import DecisionTreeRegressor
 from xgboost import XGBRegressor
 
 # === Custom Project Modules ===
+from src.components.data_transformation import DataTransformationConfig
 from src.exception import CustomException
 from src.logger import logging
+from src.profiler import profiler
 from src.utils import save_object, evaluate_models
 
 
@@ -24,9 +26,10 @@ from src.utils import save_object, evaluate_models
 # ১️⃣ ModelTrainerConfig → Configuration Class
 # ===========================================
 # এই dataclass শুধু model save করার path রাখবে।
+# Compact run হলে preprocessor-এর মতো artifacts/compact/ এ save হয়।
 @dataclass
 class ModelTrainerConfig:
-    trained_model_file_path: str = os.path.join("artifacts", "model.pkl")
+    trained_model_file_path: str = os.path.join(DataTransformationConfig.artifacts_dir, "model.pkl")
 
 
 # ===========================================
@@ -36,6 +39,55 @@ class ModelTrainer:
     def __init__(self):
         self.model_trainer_config = ModelTrainerConfig()  # config object initialize
 
+    def get_models(self):
+        """
+        Candidate regressors, keyed by the name used in reports.
+        """
+        models = {
+            "Random Forest": RandomForestRegressor(),
+            "Decision Tree": DecisionTreeRegressor(),
+            "Gradient Boosting": GradientBoostingRegressor(),
+            "Linear Regression": LinearRegression(),
+            "XGBRegressor": XGBRegressor(),
+            "CatBoosting Regressor": CatBoostRegressor(verbose=False),
+            "AdaBoost Regressor": AdaBoostRegressor(),
+        }
+        return models
+
+    def get_params(self):
+        """
+        Hyperparameter grid searched for each model in ``get_models``.
+        """
+        params = {
+            "Decision Tree": {
+                'criterion': ['squared_error', 'friedman_mse', 'absolute_error', 'poisson'],
+            },
+            "Random Forest": {
+                'n_estimators': [8, 16, 32, 64, 128, 256]
+            },
+            "Gradient Boosting": {
+                'learning_rate': [0.1, 0.01, 0.05, 0.001],
+                'subsample': [0.6, 0.7, 0.8, 0.9],
+                'n_estimators': [8, 16, 32, 64, 128, 256]
+            },
+            "Linear Regression": {},
+            "XGBRegressor": {
+                'learning_rate': [0.1, 0.01, 0.05, 0.001],
+                'n_estimators': [8, 16, 32, 64, 128, 256]
+            },
+            "CatBoosting Regressor": {
+                'depth': [6, 8, 10],
+                'learning_rate': [0.01, 0.05, 0.1],
+                'iterations': [30, 50, 100]
+            },
+            "AdaBoost Regressor": {
+                'learning_rate': [0.1, 0.01, 0.5, 0.001],
+                'n_estimators': [8, 16, 32, 64, 128, 256]
+            }
+        }
+        return params
+
+    @profiler.profile("model_trainer")
     def initiate_model_trainer(self, train_array, test_array):
         """
         ✅ This function trains multiple ML models, compares performance,
@@ -52,45 +104,9 @@ class ModelTrainer:
                 test_array[:, -1],
             )
 
-            # -------- Step 2: Define ML Models --------
-            models = {
-                "Random Forest": RandomForestRegressor(),
-                "Decision Tree": DecisionTreeRegressor(),
-                "Gradient Boosting": GradientBoostingRegressor(),
-                "Linear Regression": LinearRegression(),
-                "XGBRegressor": XGBRegressor(),
-                "CatBoosting Regressor": CatBoostRegressor(verbose=False),
-                "AdaBoost Regressor": AdaBoostRegressor(),
-            }
-
-            # -------- Step 3: Define Hyperparameter Grid --------
-            params = {
-                "Decision Tree": {
-                    'criterion': ['squared_error', 'friedman_mse', 'absolute_error', 'poisson'],
-                },
-                "Random Forest": {
-                    'n_estimators': [8, 16, 32, 64, 128, 256]
-                },
-                "Gradient Boosting": {
-                    'learning_rate': [0.1, 0.01, 0.05, 0.001],
-                    'subsample': [0.6, 0.7, 0.8, 0.9],
-                    'n_estimators': [8, 16, 32, 64, 128, 256]
-                },
-                "Linear Regression": {},
-                "XGBRegressor": {
-                    'learning_rate': [0.1, 0.01, 0.05, 0.001],
-                    'n_estimators': [8, 16, 32, 64, 128, 256]
-                },
-                "CatBoosting Regressor": {
-                    'depth': [6, 8, 10],
-                    'learning_rate': [0.01, 0.05, 0.1],
-                    'iterations': [30, 50, 100]
-                },
-                "AdaBoost Regressor": {
-                    'learning_rate': [0.1, 0.01, 0.5, 0.001],
-                    'n_estimators': [8, 16, 32, 64, 128, 256]
-                }
-            }
+            # -------- Step 2 & 3: Models and Hyperparameter Grid --------
+            models = self.get_models()
+            params = self.get_params()
 
             # -------- Step 4: Evaluate All Models --------
             logging.info("🚀 Model training & evaluation started")
@@ -104,12 +120,27 @@ class ModelTrainer:
                 param=params
             )
 
+            # -------- Step 5-8: Select, save and score the best model --------
+            return self.save_best_model(model_report, models, X_test, y_test)
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def save_best_model(self, model_report, models, X_test, y_test):
+        """
+        Pick the best model from ``model_report``, save it and return its test R2.
+        Shared by the single-process trainer and the distributed train pipeline.
+        """
+        try:
             # -------- Step 5: Find the Best Model --------
             best_model_score = max(sorted(model_report.values()))
             best_model_name = list(model_report.keys())[
                 list(model_report.values()).index(best_model_score)
             ]
             best_model = models[best_model_name]
+            # Compact-dtype parity check এবং report-এর জন্য রাখা হচ্ছে
+            self.best_model_name = best_model_name
+            self.best_model = best_model
 
             logging.info(f"🏆 Best Model Found: {best_model_name} (Score: {best_model_score:.4f})")
 
@@ -4,9 +4,12 @@
 
 import sys
 import os
+import time
 import pandas as pd
 from src.exception import CustomException  # Custom exception class for better error handling
 from src.utils import load_object          # Utility function to load saved model/preprocessor objects
+from src.components.artifact_store import ArtifactStore  # Versioned model/preprocessor store
+from src.components.data_transformation import to_compact_dtypes  # Compact dtype mode
 
 
 # ======================================
@@ -15,14 +18,56 @@ from src.utils import load_object          # Utility function to load saved mode
 class PredictPipeline:
     """
     This class handles the prediction workflow:
-    1. Loads the pre-trained model and preprocessor.
+    1. Loads the pre-trained model and preprocessor (once, then cached).
     2. Transforms input data using the preprocessor.
     3. Runs predictions using the trained model.
     """
 
-    def __init__(self):
-        # No initialization needed for now
-        pass
+    def __init__(self, model_path=None, preprocessor_path=None, version=None):
+        # Explicit paths win; otherwise use a pinned store version, then the
+        # active store version, then the fixed artifacts/ paths
+        self.model_path = model_path
+        self.preprocessor_path = preprocessor_path
+        self.version = version
+        self.artifact_store = ArtifactStore()
+        # (cache key, model, preprocessor) → unpickled once, reused across requests
+        self._loaded = None
+
+    def resolve_paths(self):
+        """
+        Model/preprocessor paths to load for this call. The store's ACTIVE
+        pointer is re-read every time, so a deploy or rollback applies
+        to the next request without a restart.
+        """
+        resolved = self.artifact_store.resolve(self.version) or (
+            os.path.join("artifacts", "model.pkl"),
+            os.path.join("artifacts", "preprocessor.pkl"),
+        )
+        return self.model_path or resolved[0], self.preprocessor_path or resolved[1]
+
+    def load(self):
+        """
+        Return the (model, preprocessor) pair for the current paths.
+
+        Objects are unpickled only when the resolved paths (or the files'
+        modification times) change, e.g. after a deploy, rollback or retrain.
+        """
+        try:
+            model_path, preprocessor_path = self.resolve_paths()
+            key = (
+                model_path, os.stat(model_path).st_mtime_ns,
+                preprocessor_path, os.stat(preprocessor_path).st_mtime_ns,
+            )
+
+            loaded = self._loaded
+            if loaded is None or loaded[0] != key:
+                loaded = (key, load_object(file_path=model_path), load_object(file_path=preprocessor_path))
+                self._loaded = loaded
+
+            return loaded[1], loaded[2]
+
+        except Exception as e:
+            raise CustomException(e, sys)
 
     def predict(self, features):
         """
@@ -38,31 +83,39 @@ class PredictPipeline:
         preds : numpy.ndarray
             The predicted output from the trained ML model.
         """
-        try:
-            # -------------------------------
-            # 1️⃣ Define paths to model files
-            # -------------------------------
-            model_path = os.path.join("artifacts", "model.pkl")  # trained model
-            preprocessor_path = os.path.join("artifacts", "preprocessor.pkl")  # preprocessor (encoder, scaler, etc.)
+        preds, _ = self.timed_predict(features)
+        return preds
+
+    def timed_predict(self, features):
+        """
+        Same as ``predict``, plus the latency of transform + predict.
+        Loading (cached) is not counted, so models can be compared fairly.
 
+        Returns:
+        --------
+        tuple
+            ``(preds, elapsed_ms)``
+        """
+        try:
             # -------------------------------
-            # 2️⃣ Load model and preprocessor
+            # 1️⃣ Load model and preprocessor
             # -------------------------------
-            model = load_object(file_path=model_path)
-            preprocessor = load_object(file_path=preprocessor_path)
+            # trained model + preprocessor (encoder, scaler, etc.), cached after first load
+            model, preprocessor = self.load()
+            start = time.perf_counter()
 
             # -------------------------------
-            # 3️⃣ Preprocess input features
+            # 2️⃣ Preprocess input features
             # -------------------------------
             data_scaled = preprocessor.transform(features)
 
             # -------------------------------
-            # 4️⃣ Make predictions
+            # 3️⃣ Make predictions
             # -------------------------------
             preds = model.predict(data_scaled)
 
-            # Return prediction results
-            return preds
+            # Return prediction results with latency
+            return preds, (time.perf_counter() - start) * 1000.0
 
         except Exception as e:
             # Raise a custom exception with detailed traceback info
@@ -103,11 +156,18 @@ class CustomData:
         self.writing_score = writing_score
 
 
-    def get_data_as_data_frame(self):
+    def get_data_as_data_frame(self, compact=None):
         """
         Converts the user input into a pandas DataFrame
         so it can be directly passed into the ML pipeline.
 
+        Parameters:
+        -----------
+        compact : bool, optional
+            Use category / int8 / float32 columns instead of object / float64.
+            Defaults to the ``compact_dtypes`` flag pinned in the active
+            artifact version's schema (False when the store is empty).
+
         Returns:
         --------
         pandas.DataFrame
@@ -126,7 +186,12 @@ class CustomData:
             }
 
             # Convert to DataFrame
-            return pd.DataFrame(custom_data_input_dict)
+            df = pd.DataFrame(custom_data_input_dict)
+
+            if compact is None:
+                manifest = ArtifactStore().active_manifest()
+                compact = bool(manifest and manifest["schema"].get("compact_dtypes"))
+            return to_compact_dtypes(df) if compact else df
 
         except Exception as e:
             # If something goes wrong, raise a custom error
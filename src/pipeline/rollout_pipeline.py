@@ -0,0 +1,273 @@
+# ======================================
+# 📦 Import Required Libraries
+# ======================================
+
+import os
+import queue
+import random
+import sys
+import threading
+from dataclasses import dataclass, field
+
+from src.components.drift_monitor import HistogramSketch
+from src.exception import CustomException
+from src.logger import logging
+from src.pipeline.predict_pipeline import PredictPipeline
+
+
+# ======================================
+# ⚙️ ModelRolloutConfig → Configuration Class
+# ======================================
+# Candidate model and how much traffic it sees.
+# Every field can be overridden through environment variables at deploy time.
+@dataclass
+class ModelRolloutConfig:
+    # Preferred: an ArtifactStore version, which pins model + preprocessor together
+    candidate_version: str = field(default_factory=lambda: os.environ.get("CANDIDATE_VERSION"))
+    # Alternative: explicit files; both must be given so a model is never
+    # paired with another run's preprocessor
+    candidate_model_path: str = field(default_factory=lambda: os.environ.get("CANDIDATE_MODEL_PATH"))
+    candidate_preprocessor_path: str = field(default_factory=lambda: os.environ.get("CANDIDATE_PREPROCESSOR_PATH"))
+    # "shadow" → candidate gets mirrored traffic only
+    # "canary" → candidate answers canary_fraction of live requests
+    # "off"    → primary only
+    mode: str = field(default_factory=lambda: os.environ.get("ROLLOUT_MODE", "shadow"))
+    canary_fraction: float = field(
+        default_factory=lambda: float(os.environ.get("CANARY_FRACTION", "0.05"))
+    )
+    # Bounded so a slow candidate can never build up memory or block requests
+    max_queue_size: int = 1000
+    max_latency_ms: float = 1000.0
+
+
+# ======================================
+# ⏱️ ModelStats → Per-model latency aggregate
+# ======================================
+class ModelStats:
+    """
+    In-memory latency/error aggregate for one model.
+    Latencies go into a fixed-bin histogram so memory stays constant.
+    """
+
+    def __init__(self, max_latency_ms):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.latency = HistogramSketch(0.0, max_latency_ms, 200)
+
+    def record(self, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.latency.update(elapsed_ms)
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "p50_ms": self.latency.quantile(0.5),
+            "p95_ms": self.latency.quantile(0.95),
+            "max_ms": self.max_ms,
+        }
+
+
+# ======================================
+# 🚦 ModelRollout Class
+# ======================================
+class ModelRollout:
+    """
+    Serves the primary model while evaluating a candidate under live load.
+
+    1. Shadow: every request is answered by the primary; the candidate is
+       run on the same input in a background worker.
+    2. Canary: a configurable share of requests is answered by the candidate;
+       the primary is then run in the background for comparison.
+    3. Latency and prediction agreement for both models are aggregated in memory.
+
+    The background work is fed through a bounded queue, so the user response
+    never waits for the model that is only being evaluated.
+    """
+
+    def __init__(self, config=None, primary=None):
+        self.config = config or ModelRolloutConfig()
+        self.primary = primary or PredictPipeline()
+        self.candidate = None
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=self.config.max_queue_size)
+        self._worker = None
+        self._reset_stats()
+
+        if self.config.mode != "off" and (self.config.candidate_version or self.config.candidate_model_path):
+            self.register_candidate(
+                version=self.config.candidate_version,
+                model_path=self.config.candidate_model_path,
+                preprocessor_path=self.config.candidate_preprocessor_path,
+                mode=self.config.mode,
+            )
+
+    def _reset_stats(self):
+        self.stats = {
+            "primary": ModelStats(self.config.max_latency_ms),
+            "candidate": ModelStats(self.config.max_latency_ms),
+        }
+        self.compared = 0
+        self.dropped = 0
+        self.abs_diff_sum = 0.0
+        self.sq_diff_sum = 0.0
+        self.max_abs_diff = 0.0
+
+    def register_candidate(self, version=None, model_path=None, preprocessor_path=None,
+                           mode="shadow", canary_fraction=None):
+        """
+        Register (or replace) the candidate model and reset comparison stats.
+
+        Parameters:
+        -----------
+        version : str, optional
+            ArtifactStore version to evaluate (model + preprocessor pinned together).
+        model_path, preprocessor_path : str, optional
+            Explicit candidate files, used when no version is given; both are required.
+        mode : str
+            "shadow" or "canary".
+        canary_fraction : float, optional
+            Share of live traffic answered by the candidate in canary mode.
+        """
+        try:
+            if mode not in ("shadow", "canary"):
+                raise ValueError(f"Unknown rollout mode: {mode}")
+
+            if version:
+                candidate = PredictPipeline(version=version)
+                label = f"version {version}"
+            elif model_path and preprocessor_path:
+                candidate = PredictPipeline(model_path=model_path, preprocessor_path=preprocessor_path)
+                label = model_path
+            else:
+                raise ValueError("Register a candidate by store version, or by both model_path and preprocessor_path")
+
+            # Load before swapping in: a broken candidate is never registered,
+            # and unpickling stays off the request path
+            candidate.load()
+
+            with self._lock:
+                self.candidate = candidate
+                self.config.mode = mode
+                if canary_fraction is not None:
+                    self.config.canary_fraction = float(canary_fraction)
+                self._reset_stats()
+
+            self._start_worker()
+            logging.info(f"🚦 Candidate model registered from {label} in {mode} mode")
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+    def clear_candidate(self):
+        with self._lock:
+            self.candidate = None
+        logging.info("🚦 Candidate model removed, serving primary only")
+
+    def _start_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(target=self._run, name="model-rollout", daemon=True)
+        self._worker.start()
+
+    def _timed_predict(self, name, pipeline, features):
+        try:
+            preds, elapsed_ms = pipeline.timed_predict(features)
+        except Exception:
+            with self._lock:
+                self.stats[name].errors += 1
+            raise
+        with self._lock:
+            self.stats[name].record(elapsed_ms)
+        return preds
+
+    def predict(self, features):
+        """
+        Answer a request, routing to primary or candidate per the rollout mode.
+
+        Returns:
+        --------
+        preds : numpy.ndarray
+            Predictions from whichever model served this request.
+        """
+        preds, _ = self.predict_with_source(features)
+        return preds
+
+    def predict_with_source(self, features):
+        """
+        Same as ``predict``, plus which model answered.
+
+        Returns:
+        --------
+        tuple
+            ``(preds, served_by)`` with ``served_by`` "primary" or "candidate".
+        """
+        candidate = self.candidate
+        if candidate is None:
+            return self._timed_predict("primary", self.primary, features), "primary"
+
+        if self.config.mode == "canary" and random.random() < self.config.canary_fraction:
+            try:
+                preds = self._timed_predict("candidate", candidate, features)
+                self._submit("primary", features, preds)
+                return preds, "candidate"
+            except Exception as e:
+                # A broken candidate must not fail the request
+                logging.warning(f"⚠️ Canary prediction failed, falling back to primary: {e}")
+
+        preds = self._timed_predict("primary", self.primary, features)
+        self._submit("candidate", features, preds)
+        return preds, "primary"
+
+    def _submit(self, name, features, served_preds):
+        try:
+            self._queue.put_nowait((name, features, served_preds))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _run(self):
+        while True:
+            name, features, served_preds = self._queue.get()
+            try:
+                pipeline = self.primary if name == "primary" else self.candidate
+                if pipeline is None:
+                    continue
+                preds = self._timed_predict(name, pipeline, features)
+                self._compare(served_preds, preds)
+            except Exception as e:
+                logging.warning(f"⚠️ Background {name} prediction failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _compare(self, served_preds, other_preds):
+        with self._lock:
+            for a, b in zip(served_preds, other_preds):
+                diff = abs(float(a) - float(b))
+                self.compared += 1
+                self.abs_diff_sum += diff
+                self.sq_diff_sum += diff * diff
+                self.max_abs_diff = max(self.max_abs_diff, diff)
+
+    def get_stats(self):
+        """
+        Snapshot of latency and agreement between primary and candidate.
+        """
+        with self._lock:
+            return {
+                "mode": self.config.mode if self.candidate is not None else "off",
+                "canary_fraction": self.config.canary_fraction,
+                "primary": self.stats["primary"].to_dict(),
+                "candidate": self.stats["candidate"].to_dict(),
+                "compared": self.compared,
+                "dropped": self.dropped,
+                "pending": self._queue.qsize(),
+                "mean_abs_diff": self.abs_diff_sum / self.compared if self.compared else None,
+                "rmse_diff": (self.sq_diff_sum / self.compared) ** 0.5 if self.compared else None,
+                "max_abs_diff": self.max_abs_diff,
+            }
@@ -0,0 +1,545 @@
+# ======================================
+# 📦 Import Required Libraries
+# ======================================
+
+import argparse
+import ipaddress
+import math
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.managers import BaseManager, DictProxy
+
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+from sklearn.model_selection import ParameterGrid, cross_validate
+
+from src.components.artifact_store import ArtifactStore
+from src.components.data_ingection import DataIngestion
+from src.components.data_transformation import DataTransformation
+from src.components.model_trainer import ModelTrainer
+from src.exception import CustomException
+from src.logger import logging
+from src.profiler import profiler
+
+
+# ======================================
+# ⚙️ TrainPipelineConfig → Configuration Class
+# ======================================
+# Worker pool size, work-queue address and fault-tolerance settings.
+@dataclass
+class TrainPipelineConfig:
+    num_workers: int = os.cpu_count() or 2
+    host: str = field(default_factory=lambda: os.environ.get("TRAIN_QUEUE_HOST", "127.0.0.1"))
+    port: int = field(default_factory=lambda: int(os.environ.get("TRAIN_QUEUE_PORT", "50000")))
+    # Required for any non-loopback host: the queue exchanges pickles over TCP
+    authkey: bytes = field(
+        default_factory=lambda: os.environ.get("TRAIN_QUEUE_AUTHKEY", "").encode() or None
+    )
+    # Same folds as GridSearchCV(cv=3) in evaluate_models
+    cv: int = 3
+    # A task with no result after this long is treated as lost. Crashed local
+    # workers are detected right away; this covers remote machines and partitions
+    task_timeout_seconds: float = 900.0
+    max_retries: int = 3
+    poll_interval_seconds: float = 1.0
+
+    def get_authkey(self):
+        """
+        Authkey for the TCP work queue. A built-in key is only allowed on
+        loopback; anything reachable from other machines needs TRAIN_QUEUE_AUTHKEY.
+        """
+        if self.authkey:
+            return self.authkey
+        if _is_loopback(self.host):
+            return b"train-pipeline"
+        raise ValueError(
+            f"TRAIN_QUEUE_AUTHKEY must be set to use the work queue on non-loopback host {self.host!r}"
+        )
+
+
+def _is_loopback(host):
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+# ======================================
+# 📝 TrainingTask → One model × hyperparameter point
+# ======================================
+@dataclass
+class TrainingTask:
+    task_id: int
+    model_name: str
+    params: dict
+    attempt: int = 0
+
+
+# ======================================
+# 👷 Worker Loop
+# ======================================
+def run_worker(task_queue, result_queue, X_train, y_train, cv=3, worker_id=None, models=None):
+    """
+    Ask for a task, fit that grid point with cross-validation and push the
+    score and timings back; repeat until a ``None`` sentinel (or a lost
+    coordinator).
+
+    Messages on ``result_queue`` are ``(kind, task_id, value)`` tuples where
+    kind is "ready" (task_id None), "started", "done" or "failed". The
+    coordinator only puts a task on the queue in answer to a "ready", so every
+    queued task has a worker waiting for it; "started" tells it which worker
+    holds the task, so the task can be re-queued as soon as that worker dies.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    models = models or ModelTrainer().get_models()
+    logging.info(f"👷 Worker {worker_id} ready")
+
+    while True:
+        try:
+            result_queue.put(("ready", None, worker_id))
+            task = task_queue.get()
+        except (EOFError, OSError):
+            # Coordinator went away
+            break
+        if task is None:
+            break
+
+        try:
+            result_queue.put(("started", task.task_id, worker_id))
+        except (EOFError, OSError):
+            break
+
+        try:
+            model = clone(models[task.model_name]).set_params(**task.params)
+            # Failing folds score NaN, as in GridSearchCV; if every fold fails
+            # cross_validate raises and the task is reported as "failed"
+            cv_results = cross_validate(model, X_train, y_train, cv=cv, error_score=math.nan)
+            result_queue.put(("done", task.task_id, {
+                "mean_test_score": float(cv_results["test_score"].mean()),
+                "mean_fit_time": float(cv_results["fit_time"].mean()),
+                "std_fit_time": float(cv_results["fit_time"].std()),
+                "mean_score_time": float(cv_results["score_time"].mean()),
+                "worker": worker_id,
+            }))
+        except Exception as e:
+            result_queue.put(("failed", task.task_id, str(e)))
+
+    logging.info(f"👷 Worker {worker_id} stopped")
+
+
+def _run_worker_process(*args, **kwargs):
+    # Worker processes report fit times, so drop any tracemalloc / cProfile
+    # inherited from the coordinator (fork) before fitting anything
+    profiler.detach()
+    run_worker(*args, **kwargs)
+
+
+# ======================================
+# 📬 LocalTaskQueue → Single-machine work queue
+# ======================================
+class LocalTaskQueue:
+    """
+    Local stand-in for the network work queue: multiprocessing queues
+    served to worker processes on this machine.
+    """
+
+    def __init__(self, num_workers, X_train, y_train, cv=3, models=None):
+        self.num_workers = num_workers
+        self.tasks = multiprocessing.Queue()
+        # Manager queue: put() returns once the message is delivered, so a
+        # worker that crashes right after "started" cannot lose it (a plain
+        # multiprocessing.Queue flushes from a background thread)
+        self._manager = multiprocessing.Manager()
+        self.results = self._manager.Queue()
+        self._worker_args = (self.tasks, self.results, X_train, y_train, cv)
+        # None → workers use ModelTrainer().get_models()
+        self._models = models
+        self._processes = []
+        self._spawned = 0
+
+    def _spawn(self, index):
+        # A restarted worker gets a fresh id, so stale messages from the
+        # crashed one are never mistaken for the new process
+        self._spawned += 1
+        worker_id = f"local-{index}.{self._spawned}"
+        process = multiprocessing.Process(
+            target=_run_worker_process,
+            args=self._worker_args + (worker_id, self._models),
+            daemon=True,
+        )
+        process.start()
+        return worker_id, process
+
+    def start(self):
+        self._processes = [self._spawn(i) for i in range(self.num_workers)]
+
+    def check_workers(self):
+        """
+        Replace crashed workers.
+
+        Returns:
+        --------
+        list
+            Ids of the workers that died, so their tasks can be re-queued.
+        """
+        dead = []
+        for i, (worker_id, process) in enumerate(self._processes):
+            if not process.is_alive():
+                logging.warning(f"⚠️ Local worker {worker_id} exited with code {process.exitcode}, restarting")
+                dead.append(worker_id)
+                self._processes[i] = self._spawn(i)
+        return dead
+
+    def shutdown(self):
+        for _ in self._processes:
+            self.tasks.put(None)
+        for _, process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._manager.shutdown()
+
+
+# ======================================
+# 🌐 RemoteTaskQueue → Multi-machine work queue
+# ======================================
+class _CoordinatorManager(BaseManager):
+    pass
+
+
+class _WorkerManager(BaseManager):
+    pass
+
+
+_WorkerManager.register("get_task_queue")
+_WorkerManager.register("get_result_queue")
+_WorkerManager.register("get_payload", proxytype=DictProxy)
+
+
+class RemoteTaskQueue:
+    """
+    Work queue served over TCP by the coordinator; workers on any machine
+    join with ``python -m src.pipeline.train_pipeline --mode worker``.
+    Set TRAIN_QUEUE_HOST=0.0.0.0 on the coordinator to accept remote workers;
+    a shared TRAIN_QUEUE_AUTHKEY is then required on every machine.
+    """
+
+    def __init__(self, config, X_train, y_train):
+        self.config = config
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+        self.payload = {"X_train": X_train, "y_train": y_train, "cv": config.cv}
+        self._server = None
+
+    def start(self):
+        _CoordinatorManager.register("get_task_queue", callable=lambda: self.tasks)
+        _CoordinatorManager.register("get_result_queue", callable=lambda: self.results)
+        _CoordinatorManager.register("get_payload", callable=lambda: self.payload, proxytype=DictProxy)
+
+        # Serve from a thread so the queues above are shared with the coordinator loop
+        manager = _CoordinatorManager(address=(self.config.host, self.config.port), authkey=self.config.get_authkey())
+        self._server = manager.get_server()
+        threading.Thread(target=self._server.serve_forever, name="train-queue", daemon=True).start()
+        logging.info(f"🌐 Work queue serving on {self.config.host}:{self.config.port}")
+
+    def check_workers(self):
+        # Remote workers are not supervised here; lost tasks are retried on timeout
+        return []
+
+    def shutdown(self):
+        for _ in range(self.config.num_workers):
+            self.tasks.put(None)
+
+
+def connect_worker(config):
+    """
+    Join a coordinator's work queue from another machine and process tasks.
+    Retries the connection until the coordinator is up.
+    """
+    manager = _WorkerManager(address=(config.host, config.port), authkey=config.get_authkey())
+    while True:
+        try:
+            manager.connect()
+            break
+        except ConnectionRefusedError:
+            logging.info(f"⏳ Waiting for coordinator at {config.host}:{config.port}")
+            time.sleep(config.poll_interval_seconds)
+
+    payload = manager.get_payload().copy()
+    _run_worker_process(
+        manager.get_task_queue(),
+        manager.get_result_queue(),
+        payload["X_train"],
+        payload["y_train"],
+        payload["cv"],
+    )
+
+
+# ======================================
+# 🧮 DistributedModelTrainer → Coordinator
+# ======================================
+class DistributedModelTrainer:
+    """
+    Splits the ModelTrainer grid into tasks, hands them to workers through a
+    work queue and aggregates the best hyperparameters per model.
+
+    Tasks stay in a coordinator-side backlog until a worker reports "ready",
+    so slow or late-joining workers never cost a retry.
+
+    Fault tolerance:
+    - a task held by a local worker that crashed goes back to the backlog as
+      soon as the crash is seen;
+    - a task handed out but not finished within ``task_timeout_seconds`` goes
+      back as well (lost machine, network partition);
+    - after ``max_retries`` retries a lost task is skipped;
+    - a task whose fit raised is not retried (the error would repeat): it
+      scores NaN once, like GridSearchCV's ``error_score=nan``;
+    - duplicate results from a retried task are ignored.
+    """
+
+    def __init__(self, config, task_queue):
+        self.config = config
+        self.task_queue = task_queue
+
+    def build_tasks(self, models, params):
+        tasks = []
+        for model_name in models:
+            for grid_point in ParameterGrid(params.get(model_name, {})):
+                tasks.append(TrainingTask(task_id=len(tasks), model_name=model_name, params=grid_point))
+        return tasks
+
+    def _fail(self, task, error, worker, pending, dispatched):
+        pending.pop(task.task_id)
+        dispatched.pop(task.task_id, None)
+        logging.warning(f"⚠️ {task.model_name} {task.params} failed, scoring NaN: {error}")
+        profiler.record_grid_point(
+            task.model_name,
+            task.params,
+            mean_fit_seconds=math.nan,
+            std_fit_seconds=math.nan,
+            mean_score_seconds=math.nan,
+            mean_test_score=math.nan,
+            worker=worker,
+            error=error,
+        )
+
+    def _retry(self, task, reason, pending, dispatched, backlog):
+        dispatched.pop(task.task_id, None)
+        task.attempt += 1
+        if task.attempt > self.config.max_retries:
+            logging.warning(f"⚠️ Giving up on {task.model_name} {task.params} after {task.attempt} attempts ({reason})")
+            pending.pop(task.task_id)
+            return
+        logging.warning(f"🔁 Retrying {task.model_name} {task.params} (attempt {task.attempt}, {reason})")
+        backlog.appendleft(task)
+
+    def run_grid(self, models, params):
+        """
+        Run every grid point through the queue.
+
+        Returns:
+        --------
+        dict
+            ``{model_name: (best_cv_score, best_params)}``
+        """
+        try:
+            tasks = self.build_tasks(models, params)
+            pending = {task.task_id: task for task in tasks}
+            backlog = deque(tasks)  # not yet handed to any worker
+            dispatched = {}         # task_id → time it was handed out / started
+            running = {}            # task_id → worker that reported "started"
+            dead_workers = set()
+            waiting_workers = 0
+            best = {}
+
+            logging.info(f"🚀 Scheduling {len(tasks)} training tasks")
+
+            while pending:
+                try:
+                    kind, task_id, value = self.task_queue.results.get(timeout=self.config.poll_interval_seconds)
+                except queue.Empty:
+                    kind = None
+
+                if kind == "ready":
+                    waiting_workers += 1
+                elif kind is not None and task_id in pending:
+                    task = pending[task_id]
+                    if kind == "started":
+                        if value in dead_workers:
+                            # Crash was seen before this message arrived
+                            self._retry(task, f"worker {value} died", pending, dispatched, backlog)
+                        else:
+                            running[task_id] = value
+                            dispatched[task_id] = time.monotonic()
+                    elif kind == "done":
+                        running.pop(task_id, None)
+                        pending.pop(task_id)
+                        dispatched.pop(task_id, None)
+                        score = value["mean_test_score"]
+                        profiler.record_grid_point(
+                            task.model_name,
+                            task.params,
+                            mean_fit_seconds=value["mean_fit_time"],
+                            std_fit_seconds=value["std_fit_time"],
+                            mean_score_seconds=value["mean_score_time"],
+                            mean_test_score=score,
+                            worker=value.get("worker"),
+                        )
+                        if not math.isnan(score) and (task.model_name not in best or score > best[task.model_name][0]):
+                            best[task.model_name] = (score, task.params)
+                    elif kind == "failed":
+                        self._fail(task, value, running.pop(task_id, None), pending, dispatched)
+
+                # Hand one task to each worker that asked for one
+                while waiting_workers and backlog:
+                    task = backlog.popleft()
+                    if task.task_id not in pending:
+                        continue
+                    self.task_queue.tasks.put(task)
+                    dispatched[task.task_id] = time.monotonic()
+                    waiting_workers -= 1
+
+                now = time.monotonic()
+                for lost_id in [i for i, t in dispatched.items() if now - t > self.config.task_timeout_seconds]:
+                    running.pop(lost_id, None)
+                    self._retry(pending[lost_id], "timed out", pending, dispatched, backlog)
+
+                dead = set(self.task_queue.check_workers() or ())
+                dead_workers |= dead
+                for lost_id, worker in [(i, w) for i, w in running.items() if w in dead]:
+                    running.pop(lost_id)
+                    self._retry(pending[lost_id], f"worker {worker} died", pending, dispatched, backlog)
+
+            if not best:
+                raise RuntimeError("No training task finished successfully")
+
+            logging.info(f"✅ Grid search finished for {len(best)} models")
+            return best
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+# ======================================
+# 🏋️ TrainPipeline Class
+# ======================================
+class TrainPipeline:
+    """
+    End-to-end training entry point:
+    1. Data ingestion and transformation (same components as before).
+    2. Model × hyperparameter grid distributed over a worker pool.
+    3. Best grid point per model refit on the coordinator, best model saved
+       and published to the versioned artifact store.
+    """
+
+    def __init__(self, config=None):
+        self.config = config or TrainPipelineConfig()
+
+    def run(self, mode="local"):
+        try:
+            if mode != "local":
+                # Fail before ingestion/transformation if the queue would be unauthenticated
+                self.config.get_authkey()
+
+            train_path, test_path = DataIngestion().initiate_data_ingestion()
+            data_transformation = DataTransformation()
+            train_arr, test_arr, preprocessor_path = data_transformation.initiate_data_transformation(train_path, test_path)
+
+            X_train, y_train, X_test, y_test = (
+                train_arr[:, :-1],
+                train_arr[:, -1],
+                test_arr[:, :-1],
+                test_arr[:, -1],
+            )
+
+            trainer = ModelTrainer()
+            models = trainer.get_models()
+            params = trainer.get_params()
+
+            if mode == "local":
+                task_queue = LocalTaskQueue(self.config.num_workers, X_train, y_train, self.config.cv)
+            else:
+                task_queue = RemoteTaskQueue(self.config, X_train, y_train)
+
+            task_queue.start()
+            try:
+                with profiler.stage("distributed_grid_search"):
+                    best = DistributedModelTrainer(self.config, task_queue).run_grid(models, params)
+            finally:
+                task_queue.shutdown()
+
+            # -------- Refit best grid point per model and score on test data --------
+            model_report = {}
+            for model_name, (cv_score, best_params) in best.items():
+                with profiler.stage(f"refit:{model_name}"):
+                    model = models[model_name]
+                    model.set_params(**best_params)
+                    model.fit(X_train, y_train)
+                model_report[model_name] = r2_score(y_test, model.predict(X_test))
+                logging.info(f"📊 {model_name}: cv={cv_score:.4f} test={model_report[model_name]:.4f} {best_params}")
+
+            r2_square = trainer.save_best_model(model_report, models, X_test, y_test)
+            metadata = {"r2_score": r2_square, "model_scores": model_report}
+
+            # -------- Compact dtypes: parity of the selected model vs. float64 --------
+            # The compact pair was saved under artifacts/compact/, so a failed check
+            # leaves the artifacts/ fallback pair as it was and only skips activation
+            parity_ok = True
+            if data_transformation.data_transformation_config.compact_dtypes:
+                parity_report = data_transformation.check_compact_parity(
+                    train_path, test_path, models={trainer.best_model_name: trainer.best_model}
+                )
+                metadata["compact_parity"] = parity_report
+                parity_ok = parity_report["parity_ok"]
+                if not parity_ok:
+                    logging.error("❌ Compact dtype parity failed, publishing without activating")
+
+            # -------- Publish model + preprocessor as one versioned release --------
+            ArtifactStore().publish(
+                trainer.model_trainer_config.trained_model_file_path,
+                preprocessor_path,
+                schema=data_transformation.get_schema(),
+                metadata=metadata,
+                activate=parity_ok,
+            )
+
+            profiler.write_report()
+            return r2_square
+
+        except Exception as e:
+            raise CustomException(e, sys)
+
+
+# ======================================
+# ⚙️ Command Line Entry Point
+# ======================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the training pipeline")
+    parser.add_argument("--mode", choices=["local", "coordinator", "worker"], default="local")
+    parser.add_argument("--workers", type=int, default=None, help="local worker processes")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    config = TrainPipelineConfig()
+    if args.workers:
+        config.num_workers = args.workers
+    if args.host:
+        config.host = args.host
+    if args.port:
+        config.port = args.port
+
+    if args.mode != "local":
+        config.get_authkey()
+
+    if args.mode == "worker":
+        connect_worker(config)
+    else:
+        print(TrainPipeline(config).run(mode=args.mode))
@@ -0,0 +1,228 @@
+import cProfile
+import functools
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from src.logger import logging
+
+try:
+    import resource  # Unix only, peak RSS is skipped elsewhere
+except ImportError:
+    resource = None
+
+# -------- Opt-in switches (environment variables) --------
+# PROFILE_TRAINING=1   → stage timing / RSS report
+# PROFILE_TRACEMALLOC=1 → additionally trace Python allocations per stage.
+#                         Tracing slows fits 2-4x, unevenly per model, so run it
+#                         as a separate pass and don't rank models by its timings
+# PROFILE_CPROFILE=1    → additionally dump a cProfile .prof file (snakeviz / flameprof)
+PROFILE_ENABLED = os.environ.get("PROFILE_TRAINING", "0") == "1"
+TRACEMALLOC_ENABLED = os.environ.get("PROFILE_TRACEMALLOC", "0") == "1"
+CPROFILE_ENABLED = os.environ.get("PROFILE_CPROFILE", "0") == "1"
+
+# -------- Report location (one file per run, same naming as logs) --------
+RUN_ID = datetime.now().strftime('%m_%d_%Y_%H_%M_%S')
+profiling_path = os.path.join(os.getcwd(), "artifacts", "profiling")
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class TrainingProfiler:
+    """
+    Per-stage wall/CPU time and memory recorder for the training pipeline.
+
+    Does nothing unless enabled, so the instrumentation can stay in place.
+    """
+
+    def __init__(self, enabled=False, use_cprofile=False, trace_allocations=False):
+        self.enabled = enabled
+        self.use_cprofile = use_cprofile
+        self.trace_allocations = trace_allocations
+        self.records = []
+        self.grid_points = []
+        self._stack = []
+        self._cprofile = None
+        if self.enabled:
+            self.enable(use_cprofile=use_cprofile, trace_allocations=trace_allocations)
+
+    def enable(self, use_cprofile=False, trace_allocations=False):
+        self.enabled = True
+        self.use_cprofile = use_cprofile
+        self.trace_allocations = trace_allocations
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.use_cprofile and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def detach(self):
+        """
+        Stop tracemalloc / cProfile inherited by a worker process, so the fit
+        times it reports are not inflated by tracing.
+        """
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+        self.use_cprofile = False
+        self.trace_allocations = False
+
+    @contextmanager
+    def stage(self, name, **meta):
+        """
+        Record wall time, CPU time, peak RSS and (if enabled) tracemalloc
+        allocations for a block.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        # Fold the parent's peak so far before resetting it for this stage
+        if tracing:
+            if self._stack:
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        frame = {"peak": 0, "current": tracemalloc.get_traced_memory()[0] if tracing else 0}
+        self._stack.append(frame)
+        rss_start = _peak_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            current, traced_peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+            self._stack.pop()
+            peak = max(frame["peak"], traced_peak)
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+
+            # ru_maxrss is a process-lifetime high-water mark: the stage's own
+            # contribution is how much it raised that mark
+            rss_end = _peak_rss_mb()
+            record = {
+                "stage": name,
+                "depth": len(self._stack),
+                "wall_seconds": round(wall, 6),
+                "cpu_seconds": round(cpu, 6),
+                "peak_rss_growth_mb": None if rss_end is None else round(rss_end - rss_start, 4),
+                "process_peak_rss_mb": rss_end,
+                "alloc_net_mb": round((current - frame["current"]) / (1024 * 1024), 4) if tracing else None,
+                "alloc_peak_mb": round((peak - frame["current"]) / (1024 * 1024), 4) if tracing else None,
+            }
+            record.update(meta)
+            self.records.append(record)
+            logging.info(f"⏱️ [{name}] wall={wall:.3f}s cpu={cpu:.3f}s peak_alloc={record['alloc_peak_mb']}MB")
+
+    def profile(self, name):
+        """
+        Decorator form of ``stage`` for whole component methods.
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record_grid_search(self, model_name, cv_results):
+        """
+        Store per grid-point fit/score times from a fitted GridSearchCV's ``cv_results_``.
+        """
+        if not self.enabled:
+            return
+        for i, params in enumerate(cv_results["params"]):
+            self.record_grid_point(
+                model_name,
+                params,
+                mean_fit_seconds=cv_results["mean_fit_time"][i],
+                std_fit_seconds=cv_results["std_fit_time"][i],
+                mean_score_seconds=cv_results["mean_score_time"][i],
+                mean_test_score=cv_results["mean_test_score"][i],
+            )
+
+    def record_grid_point(self, model_name, params, mean_fit_seconds, std_fit_seconds,
+                          mean_score_seconds, mean_test_score, **meta):
+        """
+        Store fit/score times for one grid point (e.g. reported by a distributed worker).
+        """
+        if not self.enabled:
+            return
+        point = {
+            "model": model_name,
+            "params": {k: str(v) for k, v in params.items()},
+            "mean_fit_seconds": float(mean_fit_seconds),
+            "std_fit_seconds": float(std_fit_seconds),
+            "mean_score_seconds": float(mean_score_seconds),
+            "mean_test_score": float(mean_test_score),
+        }
+        point.update(meta)
+        self.grid_points.append(point)
+
+    def write_report(self, report_dir=None):
+        """
+        Write the JSON run report (and .prof file if cProfile is on).
+
+        Returns:
+        --------
+        str or None
+            Path of the JSON report, or None when profiling is disabled.
+        """
+        if not self.enabled:
+            return None
+
+        report_dir = report_dir or profiling_path
+        os.makedirs(report_dir, exist_ok=True)
+        report_path = os.path.join(report_dir, f"run_{RUN_ID}.json")
+
+        report = {
+            "run_id": RUN_ID,
+            # Timings recorded under tracemalloc are inflated; keep such runs apart
+            "tracemalloc": self.trace_allocations,
+            "process_peak_rss_mb": _peak_rss_mb(),
+            "stages": self.records,
+            # Slowest fits first; failed points (NaN times) last
+            "grid_points": sorted(
+                self.grid_points,
+                key=lambda p: -math.inf if math.isnan(p["mean_fit_seconds"]) else p["mean_fit_seconds"],
+                reverse=True,
+            ),
+        }
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            prof_path = os.path.join(report_dir, f"run_{RUN_ID}.prof")
+            self._cprofile.dump_stats(prof_path)
+            report["cprofile_path"] = prof_path
+            self._cprofile.enable()
+
+        with open(report_path, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+        logging.info(f"✅ Profiling report saved at {report_path}")
+        return report_path
+
+
+# -------- Shared instance (import like the logger) --------
+profiler = TrainingProfiler(
+    enabled=PROFILE_ENABLED, use_cprofile=CPROFILE_ENABLED, trace_allocations=TRACEMALLOC_ENABLED
+)
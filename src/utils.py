@@ -8,6 +8,7 @@ from sklearn.metrics import r2_score
 from sklearn.model_selection import GridSearchCV
 
 from src.exception import CustomException
+from src.profiler import profiler
 
 def save_object(file_path, obj):
     try:
@@ -29,11 +30,14 @@ def evaluate_models(X_train, y_train,X_test,y_test,models,param):
             model = list(models.values())[i]
             para=param[list(models.keys())[i]]
 
-            gs = GridSearchCV(model,para,cv=3)
-            gs.fit(X_train,y_train)
+            with profiler.stage(f"grid_search:{list(models.keys())[i]}"):
+                gs = GridSearchCV(model,para,cv=3)
+                gs.fit(X_train,y_train)
+            profiler.record_grid_search(list(models.keys())[i], gs.cv_results_)
 
-            model.set_params(**gs.best_params_)
-            model.fit(X_train,y_train)
+            with profiler.stage(f"refit:{list(models.keys())[i]}"):
+                model.set_params(**gs.best_params_)
+                model.fit(X_train,y_train)
 
             #model.fit(X_train, y_train)  # Train model
 
@@ -0,0 +1,52 @@
+import pytest
+
+from src.components.artifact_store import ArtifactStore, ArtifactStoreConfig
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(ArtifactStoreConfig(store_root=str(tmp_path / "store")))
+
+
+def publish(store, tmp_path, name, metadata=None):
+    model_path = tmp_path / f"model_{name}.pkl"
+    preprocessor_path = tmp_path / "preprocessor.pkl"
+    model_path.write_bytes(name.encode())
+    preprocessor_path.write_bytes(b"shared")
+    return store.publish(
+        str(model_path), str(preprocessor_path), schema={"target_column": "math_score"}, metadata=metadata
+    )
+
+
+def test_publish_deduplicates_and_activates(store, tmp_path):
+    a = publish(store, tmp_path, "a")
+    b = publish(store, tmp_path, "b")
+
+    assert store.active_version() == b
+    assert publish(store, tmp_path, "a") == a
+    # two models + one shared preprocessor
+    assert len(list((tmp_path / "store" / "objects").iterdir())) == 3
+
+
+def test_republish_keeps_each_runs_metadata(store, tmp_path):
+    a = publish(store, tmp_path, "a", metadata={"r2_score": 0.8})
+    assert publish(store, tmp_path, "a", metadata={"r2_score": 0.9}) == a
+
+    manifest = store.load_manifest(a)
+    assert manifest["metadata"] == {"r2_score": 0.9}
+    assert [run["metadata"] for run in manifest["runs"]] == [{"r2_score": 0.8}, {"r2_score": 0.9}]
+    assert store.active_manifest()["version"] == a
+
+
+def test_repeated_rollbacks_keep_moving_back(store, tmp_path):
+    a, b, c = (publish(store, tmp_path, name) for name in "abc")
+
+    assert store.rollback() == b
+    assert store.rollback() == a
+    assert store.active_version() == a
+    with pytest.raises(Exception):
+        store.rollback()
+
+    d = publish(store, tmp_path, "d")
+    assert store.active_version() == d
+    assert store.rollback() == a
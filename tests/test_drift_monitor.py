@@ -0,0 +1,108 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from src.components.drift_monitor import (
+    CategorySketch,
+    DriftMonitor,
+    DriftMonitorConfig,
+    HistogramSketch,
+    population_stability_index,
+)
+
+
+def make_rows(n, seed, score_shift=0.0, lunch_p=0.65):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "gender": rng.choice(["female", "male"], n),
+        "race_ethnicity": rng.choice(["group A", "group B", "group C", "group D", "group E"], n,
+                                     p=[0.1, 0.2, 0.3, 0.25, 0.15]),
+        "parental_level_of_education": rng.choice(["high school", "some college", "bachelor's degree"], n),
+        "lunch": rng.choice(["standard", "free/reduced"], n, p=[lunch_p, 1 - lunch_p]),
+        "test_preparation_course": rng.choice(["none", "completed"], n, p=[0.65, 0.35]),
+        "reading_score": np.clip(rng.normal(69 + score_shift, 14, n), 0, 100).round(),
+        "writing_score": np.clip(rng.normal(68 + score_shift, 15, n), 0, 100).round(),
+        "math_score": np.clip(rng.normal(66, 15, n), 0, 100).round(),
+    })
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    df = make_rows(2000, seed=0)
+    path = tmp_path / "train.csv"
+    df.to_csv(path, index=False)
+    return df, str(path)
+
+
+def test_histogram_sketch_clamps_and_estimates_quantiles():
+    sketch = HistogramSketch(0, 100, 10)
+    for value in [-5, 150, float("nan")] + list(range(100)):
+        sketch.update(value)
+
+    assert sketch.total == 102
+    assert sketch.counts[0] == 11 and sketch.counts[-1] == 11
+    assert sketch.quantile(0.5) == pytest.approx(50, abs=10)
+    assert sketch.merge(sketch).total == 204
+
+
+def test_category_sketch_caps_distinct_values():
+    sketch = CategorySketch(max_categories=2)
+    for value in ["a", "b", "c", "d", "a"]:
+        sketch.update(value)
+
+    assert sketch.counts == {"a": 2, "b": 1, CategorySketch.OTHER: 2}
+
+    other = CategorySketch(max_categories=2)
+    other.update("e")
+    merged = sketch.merge(other)
+    assert len(merged.counts) == 3 and merged.counts[CategorySketch.OTHER] == 3
+    assert merged.total == 6
+
+
+def test_psi_is_zero_for_same_distribution_and_large_for_shift():
+    expected = {"a": 500, "b": 300, "c": 200}
+
+    assert population_stability_index(expected, {"a": 50, "b": 30, "c": 20}) == pytest.approx(0.0)
+    assert population_stability_index(expected, {"a": 10, "b": 30, "c": 60}) > 0.2
+    assert population_stability_index(expected, {}) is None
+
+
+def test_no_retrain_on_resampled_training_rows(baseline):
+    df, path = baseline
+    config = DriftMonitorConfig(baseline_data_path=path)
+
+    for seed in range(10):
+        monitor = DriftMonitor(config)
+        monitor.update(df.sample(config.min_samples, replace=True, random_state=seed))
+        report = monitor.compute_drift()
+        assert not report["retrain_recommended"], report["drifted_columns"]
+
+
+def test_retrain_on_shifted_traffic_only_after_min_samples(baseline):
+    _, path = baseline
+    monitor = DriftMonitor(DriftMonitorConfig(baseline_data_path=path))
+
+    monitor.update(make_rows(100, seed=1, score_shift=-20, lunch_p=0.2))
+    assert not monitor.compute_drift()["retrain_recommended"]
+
+    monitor.update(make_rows(500, seed=2, score_shift=-20, lunch_p=0.2))
+    report = monitor.compute_drift()
+    assert report["retrain_recommended"]
+    assert {"reading_score", "writing_score", "lunch"} <= set(report["drifted_columns"])
+
+
+def test_old_traffic_ages_out_of_windows(baseline):
+    _, path = baseline
+    monitor = DriftMonitor(DriftMonitorConfig(baseline_data_path=path, window_size=500, min_samples=300))
+
+    monitor.update(make_rows(500, seed=1, score_shift=-20))
+    assert monitor.compute_drift()["retrain_recommended"]
+
+    # Two full windows of normal traffic push the shifted rows out
+    for seed in (2, 3):
+        monitor.update(make_rows(500, seed=seed))
+    monitor.update(make_rows(10, seed=4))
+    report = monitor.compute_drift()
+    assert report["samples"] == 510
+    assert not report["retrain_recommended"]
@@ -0,0 +1,78 @@
+import json
+import tracemalloc
+
+import pytest
+
+from src.profiler import TrainingProfiler
+
+
+@pytest.fixture(autouse=True)
+def stop_tracing():
+    yield
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = TrainingProfiler()
+
+    with profiler.stage("noop"):
+        pass
+    profiler.record_grid_point("m", {}, 1.0, 0.0, 0.1, 0.5)
+
+    assert profiler.records == [] and profiler.grid_points == []
+    assert profiler.write_report(str(tmp_path)) is None
+
+
+def test_timing_only_by_default():
+    profiler = TrainingProfiler(enabled=True)
+
+    @profiler.profile("outer")
+    def outer():
+        with profiler.stage("inner", model="m"):
+            sum(range(10000))
+
+    outer()
+
+    assert not tracemalloc.is_tracing()
+    inner, outer_record = profiler.records
+    assert (inner["stage"], inner["depth"], inner["model"]) == ("inner", 1, "m")
+    assert (outer_record["stage"], outer_record["depth"]) == ("outer", 0)
+    assert outer_record["wall_seconds"] >= inner["wall_seconds"] >= 0
+    assert inner["alloc_peak_mb"] is None
+
+
+def test_allocation_tracing_is_opt_in():
+    profiler = TrainingProfiler(enabled=True, trace_allocations=True)
+
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            block = bytearray(8 * 1024 * 1024)
+        del block
+
+    inner, outer = profiler.records
+    assert inner["alloc_peak_mb"] >= 8
+    # The parent's peak includes its children
+    assert outer["alloc_peak_mb"] >= inner["alloc_peak_mb"]
+
+    profiler.detach()
+    assert not tracemalloc.is_tracing() and not profiler.enabled
+
+
+def test_report_ranks_grid_points_by_fit_time(tmp_path):
+    profiler = TrainingProfiler(enabled=True)
+    profiler.record_grid_search("tree", {
+        "params": [{"max_depth": 2}, {"max_depth": 8}],
+        "mean_fit_time": [0.1, 0.4],
+        "std_fit_time": [0.0, 0.01],
+        "mean_score_time": [0.01, 0.01],
+        "mean_test_score": [0.7, 0.8],
+    })
+    profiler.record_grid_point("linear", {}, 0.2, 0.0, 0.01, 0.85, worker="w1")
+
+    with open(profiler.write_report(str(tmp_path))) as report_file:
+        report = json.load(report_file)
+
+    assert report["tracemalloc"] is False
+    assert [p["mean_fit_seconds"] for p in report["grid_points"]] == [0.4, 0.2, 0.1]
+    assert report["grid_points"][1]["worker"] == "w1"
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("dill")
+
+from sklearn.dummy import DummyRegressor
+from sklearn.preprocessing import FunctionTransformer
+
+from src.exception import CustomException
+from src.pipeline.predict_pipeline import PredictPipeline
+from src.pipeline.rollout_pipeline import ModelRollout, ModelRolloutConfig
+from src.utils import save_object
+
+FEATURES = np.zeros((3, 1))
+
+
+def make_pipeline(tmp_path, name, constant):
+    model_path = str(tmp_path / f"{name}_model.pkl")
+    preprocessor_path = str(tmp_path / f"{name}_preprocessor.pkl")
+    save_object(model_path, DummyRegressor(strategy="constant", constant=constant).fit(FEATURES, [0, 0, 0]))
+    save_object(preprocessor_path, FunctionTransformer())
+    return model_path, preprocessor_path
+
+
+@pytest.fixture
+def rollout(tmp_path):
+    model_path, preprocessor_path = make_pipeline(tmp_path, "primary", 1.0)
+    primary = PredictPipeline(model_path=model_path, preprocessor_path=preprocessor_path)
+    return ModelRollout(ModelRolloutConfig(candidate_version=None, candidate_model_path=None, mode="off"), primary)
+
+
+def test_shadow_serves_primary_and_compares_candidate(rollout, tmp_path):
+    rollout.register_candidate(None, *make_pipeline(tmp_path, "candidate", 3.0), mode="shadow")
+
+    for _ in range(4):
+        preds, served_by = rollout.predict_with_source(FEATURES)
+        assert served_by == "primary" and list(preds) == [1.0, 1.0, 1.0]
+    rollout._queue.join()
+
+    stats = rollout.get_stats()
+    assert stats["mode"] == "shadow"
+    assert stats["primary"]["count"] == 4 and stats["candidate"]["count"] == 4
+    assert stats["compared"] == 12
+    assert stats["mean_abs_diff"] == pytest.approx(2.0)
+
+
+def test_canary_serves_candidate(rollout, tmp_path):
+    rollout.register_candidate(None, *make_pipeline(tmp_path, "candidate", 3.0), mode="canary", canary_fraction=1.0)
+
+    preds, served_by = rollout.predict_with_source(FEATURES)
+    rollout._queue.join()
+
+    assert served_by == "candidate" and list(preds) == [3.0, 3.0, 3.0]
+    assert rollout.get_stats()["primary"]["count"] == 1
+    assert rollout.get_stats()["max_abs_diff"] == pytest.approx(2.0)
+
+
+def test_broken_candidate_is_not_registered(rollout, tmp_path):
+    model_path, preprocessor_path = make_pipeline(tmp_path, "candidate", 3.0)
+    rollout.register_candidate(model_path=model_path, preprocessor_path=preprocessor_path)
+
+    with pytest.raises(CustomException):
+        rollout.register_candidate(model_path=str(tmp_path / "missing.pkl"), preprocessor_path=preprocessor_path)
+
+    assert rollout.candidate.model_path == model_path
+    assert rollout.get_stats()["mode"] == "shadow"
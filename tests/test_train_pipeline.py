@@ -0,0 +1,166 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("catboost")
+pytest.importorskip("xgboost")
+
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import LinearRegression
+from sklearn.tree import DecisionTreeRegressor
+
+from src.exception import CustomException
+from src.pipeline.train_pipeline import (
+    DistributedModelTrainer,
+    LocalTaskQueue,
+    TrainPipelineConfig,
+    run_worker,
+)
+
+
+class CrashOnceRegressor(RegressorMixin, BaseEstimator):
+    """Kills its worker process on the first fit, then behaves like a mean predictor."""
+
+    def __init__(self, marker_path=None):
+        self.marker_path = marker_path
+
+    def fit(self, X, y):
+        if not os.path.exists(self.marker_path):
+            open(self.marker_path, "w").close()
+            os._exit(1)
+        self.mean_ = float(np.mean(y))
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean_)
+
+
+class AlwaysFailRegressor(RegressorMixin, BaseEstimator):
+    """Deterministic fit error; counts how often it was fitted."""
+
+    fit_calls = 0
+
+    def fit(self, X, y):
+        type(self).fit_calls += 1
+        raise ValueError("bad grid point")
+
+
+class InProcessQueue:
+    """Coordinator-facing queue stand-in whose workers are threads started later."""
+
+    def __init__(self):
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+
+    def check_workers(self):
+        return []
+
+
+@pytest.fixture
+def data():
+    rng = np.random.RandomState(0)
+    X = rng.rand(60, 3)
+    y = X @ np.array([3.0, -2.0, 1.0]) + 0.01 * rng.rand(60)
+    return X, y
+
+
+def make_config(**overrides):
+    config = TrainPipelineConfig(num_workers=2, task_timeout_seconds=2.0, max_retries=2, poll_interval_seconds=0.05)
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+def test_local_queue_skips_failing_grid_points(data):
+    X, y = data
+    models = {"Linear Regression": LinearRegression(), "Decision Tree": DecisionTreeRegressor(random_state=0)}
+    params = {"Linear Regression": {}, "Decision Tree": {"max_depth": [1, 4], "criterion": ["squared_error", "bogus"]}}
+
+    task_queue = LocalTaskQueue(2, X, y, cv=3, models=models)
+    task_queue.start()
+    try:
+        best = DistributedModelTrainer(make_config(), task_queue).run_grid(models, params)
+    finally:
+        task_queue.shutdown()
+
+    assert set(best) == {"Linear Regression", "Decision Tree"}
+    assert best["Decision Tree"][1] == {"criterion": "squared_error", "max_depth": 4}
+    assert best["Linear Regression"][0] > 0.99
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="test model must be inherited by workers")
+def test_local_queue_retries_task_lost_with_crashed_worker(data, tmp_path):
+    X, y = data
+    models = {"Crash Once": CrashOnceRegressor(), "Linear Regression": LinearRegression()}
+    params = {"Crash Once": {"marker_path": [str(tmp_path / "crashed")]}, "Linear Regression": {}}
+
+    task_queue = LocalTaskQueue(2, X, y, cv=3, models=models)
+    task_queue.start()
+    start = time.monotonic()
+    try:
+        # Re-queued when the crash is seen, not after the task timeout
+        best = DistributedModelTrainer(make_config(task_timeout_seconds=120.0), task_queue).run_grid(models, params)
+    finally:
+        task_queue.shutdown()
+
+    assert (tmp_path / "crashed").exists()
+    assert set(best) == {"Crash Once", "Linear Regression"}
+    assert time.monotonic() - start < 60
+
+
+def test_failed_fit_is_not_retried(data):
+    X, y = data
+    models = {"Always Fail": AlwaysFailRegressor(), "Linear Regression": LinearRegression()}
+    params = {"Always Fail": {}, "Linear Regression": {}}
+    task_queue = InProcessQueue()
+    thread = threading.Thread(
+        target=run_worker, args=(task_queue.tasks, task_queue.results, X, y, 3, "w", models), daemon=True
+    )
+    thread.start()
+    try:
+        best = DistributedModelTrainer(make_config(max_retries=3), task_queue).run_grid(models, params)
+    finally:
+        task_queue.tasks.put(None)
+        thread.join(timeout=5)
+
+    assert set(best) == {"Linear Regression"}
+    # One task, three folds: scored NaN once instead of 1 + max_retries attempts
+    assert AlwaysFailRegressor.fit_calls == 3
+
+
+def test_late_workers_do_not_use_up_retries(data):
+    X, y = data
+    models = {"Linear Regression": LinearRegression()}
+    params = {"Linear Regression": {"fit_intercept": [True, False]}}
+    task_queue = InProcessQueue()
+
+    def late_worker():
+        # Join well after task_timeout_seconds with max_retries=0
+        time.sleep(0.5)
+        run_worker(task_queue.tasks, task_queue.results, X, y, cv=3, worker_id="late", models=models)
+
+    thread = threading.Thread(target=late_worker, daemon=True)
+    thread.start()
+    try:
+        config = make_config(task_timeout_seconds=0.2, max_retries=0)
+        best = DistributedModelTrainer(config, task_queue).run_grid(models, params)
+    finally:
+        task_queue.tasks.put(None)
+        thread.join(timeout=5)
+
+    assert "Linear Regression" in best
+
+
+def test_remote_queue_requires_authkey_off_loopback():
+    config = make_config(host="0.0.0.0", authkey=None)
+    with pytest.raises(ValueError):
+        config.get_authkey()
+
+    assert make_config(host="127.0.0.1", authkey=None).get_authkey()
+    assert make_config(host="0.0.0.0", authkey=b"secret").get_authkey() == b"secret"